@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Fail if two test modules under tests/ have identical contents.
+
+pytest collects every test_*.py file it finds, so a copied module silently runs
+the whole suite twice. Run this before committing (or from a pre-commit hook).
+
+Usage:
+    python scripts/dev/check_no_dup_tests.py [tests-dir]
+"""
+
+import hashlib
+import sys
+from pathlib import Path
+
+
+def find_duplicates(tests_dir: Path) -> dict[str, list[Path]]:
+    """Group test modules by content hash, keeping only groups with more than one file."""
+    by_hash: dict[str, list[Path]] = {}
+    for path in sorted(tests_dir.glob("*.py")):
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        by_hash.setdefault(digest, []).append(path)
+    return {digest: paths for digest, paths in by_hash.items() if len(paths) > 1}
+
+
+def main() -> int:
+    tests_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).parents[2] / "tests"
+    duplicates = find_duplicates(tests_dir)
+
+    if not duplicates:
+        print(f"✅ No duplicate test modules in {tests_dir}")
+        return 0
+
+    print("❌ Duplicate test modules found:")
+    for paths in duplicates.values():
+        print("   " + ", ".join(str(path) for path in paths))
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
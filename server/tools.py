@@ -93,7 +93,7 @@ This implementation includes robust error handling for all Databricks Genie API
    - Chunk offset information for pagination
 
 10. POLLING STRATEGY
-    - Configurable polling intervals (default: 2 seconds)
+    - Polling backs off from 100ms up to 2 seconds between status checks
     - Maximum attempts limit (default: 30 attempts or max_wait_seconds)
     - Terminal state detection to stop polling early
     - Detailed poll attempt tracking in responses
@@ -128,6 +128,13 @@ Example 3: Fetch specific query results
         attachment_id="01f0e35763041059b7102eca6703d021"
     )
 
+Example 4: Submit a query by space name (no space_id lookup round-trip)
+    result = query_genie_by_name(
+        name="US Stocks Price & Volume",
+        query="What datasets are available?"
+    )
+    # Returns the query_space_* response plus space_id and the poll tool to call next
+
 === ERROR RESPONSE FORMAT ===
 
 All functions return errors in a consistent format:
@@ -153,6 +160,7 @@ Common error codes:
 - PERMISSION_DENIED: Insufficient permissions
 - UNAUTHENTICATED: Authentication failed
 - RESOURCE_EXHAUSTED: Rate limit exceeded
+- SPACE_NOT_FOUND: No configured Genie space matches the given name
 
 === TESTING RECOMMENDATIONS ===
 
@@ -171,8 +179,11 @@ To thoroughly test this implementation:
 """
 from typing import Any, Optional
 import requests
+from requests.adapters import HTTPAdapter
 import os
+import re
 import time
+from string import Template
 
 from dotenv import load_dotenv; load_dotenv()
 
@@ -185,10 +196,20 @@ WORKSPACE_URL = "https://" + os.getenv("DATABRICKS_HOST", "")
 M2M_CLIENT_ID = os.getenv("DATABRICKS_CLIENT_ID", "")
 M2M_CLIENT_SECRET = os.getenv("DATABRICKS_CLIENT_SECRET", "")
 
+# Fixed prefix shared by every Genie spaces endpoint, built once at import time
+_GENIE_BASE = f"{WORKSPACE_URL}/api/2.0/genie/spaces/"
+
+# Shared HTTP session so Genie API calls reuse keep-alive connections to the workspace
+# instead of paying a new TCP + TLS handshake for every request and poll
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 # Genie API Constants
 MAX_POLL_ATTEMPTS = 30  # Maximum number of polling attempts
-POLL_INTERVAL_SECONDS = 2  # Time to wait between polls
+INITIAL_POLL_INTERVAL_SECONDS = 0.1  # First wait between polls; doubles after each poll
+POLL_INTERVAL_SECONDS = 2  # Maximum time to wait between polls
 REQUEST_TIMEOUT_SECONDS = 30  # HTTP request timeout
+MAX_QUERY_LENGTH = 10000  # Maximum characters in a natural language query
 MAX_RETRIES = 3  # Maximum number of retries for transient errors
 INITIAL_RETRY_DELAY = 1  # Initial delay for exponential backoff (seconds)
 
@@ -202,6 +223,22 @@ MESSAGE_STATUSES = {
     "ERROR": "An error occurred during message processing"
 }
 
+# Genie spaces exposed through dedicated query/poll/result tools.
+# Each entry generates query_space_<id>, poll_response_<id> and get_query_result_<id>.
+GENIE_SPACES = [
+    {
+        "id": "01f0d08866f11370b6735facce14e3ff",
+        "name": "US Stocks Price & Volume",
+        "topic": "historical US stock price and volume data",
+    },
+]
+
+# Case-insensitive space name -> space_id lookup, built once from GENIE_SPACES
+_SPACE_IDS_BY_NAME = {space["name"].casefold(): space["id"] for space in GENIE_SPACES}
+
+# Genie conversation, message and attachment IDs are 32-character lowercase hex strings
+_ID_RE = re.compile(r"\A[0-9a-f]{32}\Z")
+
 # Terminal states where polling should stop
 TERMINAL_MESSAGE_STATES = {"COMPLETED", "FAILED", "CANCELLED", "ERROR"}
 
@@ -287,9 +324,9 @@ def _make_api_request(
         try:
             # Make the HTTP request
             if method.upper() == "GET":
-                response = requests.get(url, headers=headers, timeout=timeout)
+                response = _HTTP_SESSION.get(url, headers=headers, timeout=timeout)
             elif method.upper() == "POST":
-                response = requests.post(url, headers=headers, json=json_payload, timeout=timeout)
+                response = _HTTP_SESSION.post(url, headers=headers, json=json_payload, timeout=timeout)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -519,6 +556,752 @@ def _extract_attachments(message_dict: dict) -> dict:
     return result
 
 
+def _start_conversation(start_url: str, query: str, conversation_id: Optional[str]) -> dict:
+    """
+    Submit a query to a Genie space and return the initial message identifiers.
+    
+    Args:
+        start_url: Precomputed start-conversation endpoint URL for the space
+        query: Natural language question to ask the Genie space
+        conversation_id: Existing conversation to continue, or None to start a new one
+        
+    Returns:
+        dict: conversation_id, message_id, status and query_content, or an error dict
+    """
+    # Validate input
+    if not query or not query.strip():
+        return {
+            "error": "INVALID_INPUT",
+            "message": "Query cannot be empty"
+        }
+    
+    # Validate query length (reasonable limit)
+    if len(query.strip()) > MAX_QUERY_LENGTH:
+        return {
+            "error": "INVALID_INPUT",
+            "message": f"Query exceeds maximum length of {MAX_QUERY_LENGTH:,} characters"
+        }
+    
+    # Validate conversation_id format if provided
+    if conversation_id:
+        if not _ID_RE.match(conversation_id):
+            return {
+                "error": "INVALID_INPUT",
+                "message": "Invalid conversation_id format. Must be a 32-character lowercase hex id."
+            }
+    
+    try:
+        # Get authenticated client
+        w = _get_workspace_client()
+        
+        # Prepare request payload
+        json_payload = {"content": query.strip()}
+        if conversation_id:
+            json_payload["conversation_id"] = conversation_id
+        
+        # Start conversation / send message
+        response_dict = _make_api_request(
+            "POST", 
+            start_url, 
+            w.config.authenticate(), 
+            json_payload
+        )
+        
+        # Extract initial response data
+        message = response_dict.get("message", {})
+        conv_id = message.get("conversation_id", "")
+        msg_id = response_dict.get("message_id", "")
+        status = message.get("status", "UNKNOWN")
+        
+        if not conv_id or not msg_id:
+            return {
+                "error": "INVALID_RESPONSE",
+                "message": "Failed to extract conversation_id or message_id from response",
+                "raw_response": response_dict
+            }
+        
+        return {
+            "conversation_id": conv_id,
+            "message_id": msg_id,
+            "status": status,
+            "query_content": query.strip()
+        }
+        
+    except Exception as e:
+        return {
+            "error": "QUERY_FAILED",
+            "message": str(e),
+            "conversation_id": conversation_id,
+            "query_content": query.strip()
+        }
+
+
+def _poll_message(
+    space_url: str,
+    conversation_id: str,
+    message_id: str,
+    max_wait_seconds: int,
+    fetch_query_results: bool
+) -> dict:
+    """
+    Poll a Genie message until it reaches a terminal state or the timeout expires.
+    
+    Args:
+        space_url: Precomputed base URL of the Genie space
+        conversation_id: The conversation ID returned when the query was submitted
+        message_id: The message ID returned when the query was submitted
+        max_wait_seconds: Maximum seconds to wait for completion
+        fetch_query_results: Whether to fetch SQL query results for completed messages
+        
+    Returns:
+        dict: Structured message status, attachments and query results, or an error dict
+    """
+    # Validate inputs
+    if not conversation_id or not message_id:
+        return {
+            "error": "INVALID_INPUT",
+            "message": "conversation_id and message_id are required"
+        }
+    
+    # Validate input formats
+    if not _ID_RE.match(conversation_id):
+        return {
+            "error": "INVALID_INPUT",
+            "message": "Invalid conversation_id format. Must be a 32-character lowercase hex id."
+        }
+    
+    if not _ID_RE.match(message_id):
+        return {
+            "error": "INVALID_INPUT",
+            "message": "Invalid message_id format. Must be a 32-character lowercase hex id."
+        }
+    
+    # Validate max_wait_seconds
+    if max_wait_seconds < 1:
+        return {
+            "error": "INVALID_INPUT",
+            "message": "max_wait_seconds must be at least 1"
+        }
+    
+    if max_wait_seconds > 600:  # 10 minutes max
+        return {
+            "error": "INVALID_INPUT",
+            "message": "max_wait_seconds cannot exceed 600 (10 minutes)"
+        }
+    
+    try:
+        # Get authenticated client
+        w = _get_workspace_client()
+        
+        # Poll quickly at first so fast answers return promptly, then back off
+        # to POLL_INTERVAL_SECONDS so long-running queries don't spam the API
+        deadline = time.monotonic() + max_wait_seconds
+        interval = INITIAL_POLL_INTERVAL_SECONDS
+        
+        # Poll for message completion
+        current_status = "SUBMITTED"
+        message_dict = {}
+        attempts = 0
+        
+        get_message_url = space_url + f"/conversations/{conversation_id}/messages/{message_id}"
+        
+        while attempts < MAX_POLL_ATTEMPTS:
+            attempts += 1
+            
+            # Get message status
+            message_dict = _make_api_request(
+                "GET",
+                get_message_url,
+                w.config.authenticate()
+            )
+            
+            current_status = message_dict.get("status", "UNKNOWN")
+            
+            # Check if we've reached a terminal state
+            if current_status in TERMINAL_MESSAGE_STATES:
+                break
+            
+            # Validate status is a known state
+            if current_status not in MESSAGE_STATUSES and current_status not in TERMINAL_MESSAGE_STATES:
+                # Unknown status - log but continue polling
+                current_status = f"UNKNOWN_{current_status}"
+            
+            # Wait before next poll, without sleeping past the deadline
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, POLL_INTERVAL_SECONDS)
+        
+        # Handle different terminal states
+        if current_status == "FAILED":
+            # Extract failure details from message if available
+            error_details = [a["error"] for a in message_dict.get("attachments", ()) if "error" in a]
+            
+            error_msg = "The Genie message failed to process"
+            if error_details:
+                error_msg += f": {error_details[0].get('message', 'Unknown error')}"
+            
+            return {
+                "error": "MESSAGE_FAILED",
+                "message": error_msg,
+                "status": current_status,
+                "poll_attempts": attempts,
+                "error_details": error_details,
+                "raw_response": message_dict
+            }
+        
+        if current_status == "CANCELLED":
+            return {
+                "error": "MESSAGE_CANCELLED",
+                "message": "The Genie message was cancelled",
+                "status": current_status,
+                "poll_attempts": attempts
+            }
+        
+        if current_status == "ERROR":
+            # Extract error details
+            error_details = [a["error"] for a in message_dict.get("attachments", ()) if "error" in a]
+            
+            error_msg = "An error occurred during message processing"
+            if error_details:
+                error_msg += f": {error_details[0].get('message', 'Unknown error')}"
+            
+            return {
+                "error": "MESSAGE_ERROR",
+                "message": error_msg,
+                "status": current_status,
+                "poll_attempts": attempts,
+                "error_details": error_details
+            }
+        
+        # Check if we timed out (not in terminal state)
+        if current_status not in TERMINAL_MESSAGE_STATES:
+            return {
+                "error": "TIMEOUT",
+                "message": f"Message did not complete within {max_wait_seconds} seconds. Current status: {current_status}",
+                "status": current_status,
+                "poll_attempts": attempts,
+                "suggestion": "Try polling again with a longer timeout or use this function again with the same conversation_id and message_id"
+            }
+        
+        # Extract structured data from completed message
+        result = {
+            "status": current_status,
+            "query_content": message_dict.get("content", ""),
+            "attachments": _extract_attachments(message_dict),
+            "poll_attempts": attempts,
+            "query_results": []
+        }
+        
+        # Fetch actual query results if requested
+        if fetch_query_results and result["attachments"]["queries"]:
+            for query_info in result["attachments"]["queries"]:
+                attachment_id = query_info.get("attachment_id", "")
+                
+                if not attachment_id:
+                    continue
+                
+                try:
+                    # Fetch query results for this attachment
+                    query_result_url = get_message_url + f"/attachments/{attachment_id}/query-result"
+                    
+                    query_result_dict = _make_api_request(
+                        "GET",
+                        query_result_url,
+                        w.config.authenticate()
+                    )
+                    
+                    # Extract data from statement response
+                    statement_response = query_result_dict.get("statement_response", {})
+                    if not statement_response:
+                        result["query_results"].append({
+                            "attachment_id": attachment_id,
+                            "error": "No statement_response in query result",
+                            "raw_response": query_result_dict
+                        })
+                        continue
+                    
+                    statement_status = statement_response.get("status", {}).get("state", "UNKNOWN")
+                    statement_id = statement_response.get("statement_id", "")
+                    
+                    # Handle different statement execution states
+                    if statement_status == "SUCCEEDED":
+                        manifest = statement_response.get("manifest", {})
+                        result_data = statement_response.get("result", {})
+                        
+                        # Build structured query result
+                        query_result = {
+                            "attachment_id": attachment_id,
+                            "statement_id": statement_id,
+                            "status": statement_status,
+                            "schema": {
+                                "columns": manifest.get("schema", {}).get("columns", [])
+                            },
+                            "data": result_data.get("data_array", []),
+                            "row_count": manifest.get("total_row_count", 0),
+                            "truncated": manifest.get("truncated", False)
+                        }
+                        
+                        # Add chunk information for large results
+                        if manifest.get("total_chunk_count", 1) > 1:
+                            query_result["chunk_info"] = {
+                                "total_chunks": manifest.get("total_chunk_count", 1),
+                                "current_chunk": result_data.get("chunk_index", 0),
+                                "row_offset": result_data.get("row_offset", 0),
+                                "note": "This result contains only a portion of the data. Additional chunks exist."
+                            }
+                        
+                        result["query_results"].append(query_result)
+                        
+                    elif statement_status in {"PENDING", "RUNNING"}:
+                        # Query is still executing
+                        result["query_results"].append({
+                            "attachment_id": attachment_id,
+                            "statement_id": statement_id,
+                            "status": statement_status,
+                            "message": f"Query execution is {statement_status.lower()}. Poll again to get results.",
+                            "note": "Query has not completed execution yet"
+                        })
+                        
+                    elif statement_status == "FAILED":
+                        # Query execution failed - extract error details
+                        status_obj = statement_response.get("status", {})
+                        error_msg = status_obj.get("error", {}).get("message", "Query execution failed")
+                        error_code = status_obj.get("error", {}).get("error_code", "UNKNOWN")
+                        
+                        result["query_results"].append({
+                            "attachment_id": attachment_id,
+                            "statement_id": statement_id,
+                            "status": statement_status,
+                            "error": f"Query execution failed [{error_code}]: {error_msg}",
+                            "error_details": status_obj.get("error", {})
+                        })
+                        
+                    elif statement_status == "CANCELLED":
+                        result["query_results"].append({
+                            "attachment_id": attachment_id,
+                            "statement_id": statement_id,
+                            "status": statement_status,
+                            "message": "Query execution was cancelled"
+                        })
+                        
+                    elif statement_status == "CLOSED":
+                        result["query_results"].append({
+                            "attachment_id": attachment_id,
+                            "statement_id": statement_id,
+                            "status": statement_status,
+                            "message": "Query execution was closed. Results may no longer be available."
+                        })
+                        
+                    else:
+                        # Unknown state
+                        result["query_results"].append({
+                            "attachment_id": attachment_id,
+                            "statement_id": statement_id,
+                            "status": statement_status,
+                            "error": f"Unknown query execution status: {statement_status}",
+                            "statement_response": statement_response
+                        })
+                        
+                except Exception as e:
+                    # Failed to fetch results for this specific query
+                    # Don't fail the entire response, just note the error
+                    error_msg = str(e)
+                    
+                    # Check if this is a "not a valid query attachment" error
+                    if "not a valid query attachment" in error_msg.lower():
+                        result["query_results"].append({
+                            "attachment_id": attachment_id,
+                            "error": "This attachment is not a query result attachment",
+                            "note": "Only query attachments can have results fetched"
+                        })
+                    else:
+                        result["query_results"].append({
+                            "attachment_id": attachment_id,
+                            "error": f"Failed to fetch query results: {error_msg}"
+                        })
+        
+        return result
+        
+    except Exception as e:
+        return {
+            "error": "POLL_FAILED",
+            "message": str(e),
+            "conversation_id": conversation_id,
+            "message_id": message_id
+        }
+
+
+def _fetch_query_result(
+    space_url: str,
+    conversation_id: str,
+    message_id: str,
+    attachment_id: str
+) -> dict:
+    """
+    Fetch the SQL statement result for a single Genie query attachment.
+    
+    Args:
+        space_url: Precomputed base URL of the Genie space
+        conversation_id: The conversation ID
+        message_id: The message ID containing the query
+        attachment_id: The query attachment ID
+        
+    Returns:
+        dict: Statement status, schema and data rows, or an error dict
+    """
+    # Validate inputs
+    if not all([conversation_id, message_id, attachment_id]):
+        return {
+            "error": "INVALID_INPUT",
+            "message": "conversation_id, message_id, and attachment_id are all required"
+        }
+    
+    # Validate input formats
+    if not _ID_RE.match(conversation_id):
+        return {
+            "error": "INVALID_INPUT",
+            "message": "Invalid conversation_id format. Must be a 32-character lowercase hex id."
+        }
+    
+    if not _ID_RE.match(message_id):
+        return {
+            "error": "INVALID_INPUT",
+            "message": "Invalid message_id format. Must be a 32-character lowercase hex id."
+        }
+    
+    if not _ID_RE.match(attachment_id):
+        return {
+            "error": "INVALID_INPUT",
+            "message": "Invalid attachment_id format. Must be a 32-character lowercase hex id."
+        }
+    
+    try:
+        # Get authenticated client
+        w = _get_workspace_client()
+        
+        # Fetch query results
+        query_result_url = space_url + (
+            f"/conversations/{conversation_id}/messages/{message_id}"
+            f"/attachments/{attachment_id}/query-result"
+        )
+        
+        response_dict = _make_api_request(
+            "GET",
+            query_result_url,
+            w.config.authenticate()
+        )
+        
+        # Parse statement response
+        statement_response = response_dict.get("statement_response", {})
+        
+        if not statement_response:
+            return {
+                "error": "INVALID_RESPONSE",
+                "message": "No statement_response in API response",
+                "raw_response": response_dict
+            }
+        
+        statement_id = statement_response.get("statement_id", "")
+        status_obj = statement_response.get("status", {})
+        status = status_obj.get("state", "UNKNOWN")
+        
+        # Handle different statement states
+        if status == "SUCCEEDED":
+            # Extract result data
+            manifest = statement_response.get("manifest", {})
+            result_data = statement_response.get("result", {})
+            schema = manifest.get("schema", {})
+            
+            result = {
+                "statement_id": statement_id,
+                "status": status,
+                "schema": {
+                    "column_count": schema.get("column_count", 0),
+                    "columns": schema.get("columns", [])
+                },
+                "data": result_data.get("data_array", []),
+                "row_count": manifest.get("total_row_count", 0),
+                "byte_count": manifest.get("total_byte_count", 0),
+                "truncated": manifest.get("truncated", False)
+            }
+            
+            # Add chunk information if result is chunked
+            total_chunks = manifest.get("total_chunk_count", 1)
+            if total_chunks > 1:
+                result["chunk_info"] = {
+                    "total_chunks": total_chunks,
+                    "current_chunk": result_data.get("chunk_index", 0),
+                    "row_offset": result_data.get("row_offset", 0),
+                    "row_count_in_chunk": result_data.get("row_count", 0),
+                    "note": "This is a chunked result. Only one chunk is returned per request."
+                }
+            
+            return result
+            
+        elif status in {"PENDING", "RUNNING"}:
+            return {
+                "statement_id": statement_id,
+                "status": status,
+                "message": f"Query is still {status.lower()}. Please try again in a few moments.",
+                "note": "Query execution has not completed yet"
+            }
+            
+        elif status == "FAILED":
+            error_info = status_obj.get("error", {})
+            error_msg = error_info.get("message", "Query execution failed")
+            error_code = error_info.get("error_code", "UNKNOWN")
+            
+            return {
+                "error": "QUERY_EXECUTION_FAILED",
+                "message": f"Query execution failed [{error_code}]: {error_msg}",
+                "statement_id": statement_id,
+                "status": status,
+                "error_details": error_info
+            }
+            
+        elif status == "CANCELLED":
+            return {
+                "error": "QUERY_CANCELLED",
+                "message": "Query execution was cancelled",
+                "statement_id": statement_id,
+                "status": status
+            }
+            
+        elif status == "CLOSED":
+            return {
+                "error": "QUERY_CLOSED",
+                "message": "Query execution was closed. Results may no longer be available.",
+                "statement_id": statement_id,
+                "status": status
+            }
+            
+        else:
+            return {
+                "error": "UNKNOWN_STATUS",
+                "message": f"Unknown query execution status: {status}",
+                "statement_id": statement_id,
+                "status": status,
+                "raw_response": statement_response
+            }
+        
+    except Exception as e:
+        error_str = str(e)
+        
+        # Provide more specific error messages based on the exception
+        if "not a valid query attachment" in error_str.lower():
+            return {
+                "error": "INVALID_ATTACHMENT",
+                "message": "The specified attachment is not a query result attachment",
+                "conversation_id": conversation_id,
+                "message_id": message_id,
+                "attachment_id": attachment_id
+            }
+        elif "RESOURCE_NOT_FOUND" in error_str:
+            return {
+                "error": "RESOURCE_NOT_FOUND",
+                "message": "Conversation, message, or attachment not found. Please verify the IDs are correct.",
+                "conversation_id": conversation_id,
+                "message_id": message_id,
+                "attachment_id": attachment_id
+            }
+        elif "PERMISSION_DENIED" in error_str:
+            return {
+                "error": "PERMISSION_DENIED",
+                "message": "Insufficient permissions to access this query result",
+                "conversation_id": conversation_id,
+                "message_id": message_id,
+                "attachment_id": attachment_id
+            }
+        else:
+            return {
+                "error": "FETCH_FAILED",
+                "message": error_str,
+                "conversation_id": conversation_id,
+                "message_id": message_id,
+                "attachment_id": attachment_id
+            }
+
+
+# Tool descriptions for the per-space tools. $space_id, $name and $topic are
+# filled in from the matching GENIE_SPACES entry when the tools are registered.
+_QUERY_SPACE_DESCRIPTION = Template("""\
+Submit a natural language query to the $name genie space.
+
+This tool submits a query to Databricks Genie and returns immediately with the
+conversation_id and message_id. Use poll_response_$space_id
+to check the status and retrieve results.
+
+Features:
+- Ask natural language questions about $topic
+- Get dataset summaries and overviews
+- Continue conversations with conversation_id
+- Returns immediately (no waiting)
+
+Args:
+    query (str): Natural language question to ask the Genie space
+    conversation_id (Optional[str]): Continue an existing conversation. If None, starts new conversation.
+
+Returns:
+    dict: A dictionary containing:
+        - conversation_id (str): The conversation ID for follow-up queries or polling
+        - message_id (str): The message ID for polling the response
+        - status (str): Initial message status (usually SUBMITTED or EXECUTING)
+        - query_content (str): The original query
+        - error (str): Error message if something went wrong
+
+Example response:
+    {
+        "conversation_id": "01f0e34ce9641238a5018229451c2ff2",
+        "message_id": "01f0e34ce97a157983ba500ee38047ea",
+        "status": "SUBMITTED",
+        "query_content": "What stock had the most traded volume in 2025?"
+    }
+
+Next steps:
+    Use poll_response_$space_id with the returned 
+    conversation_id and message_id to retrieve the results.
+
+Note:
+    - The Genie space contains $topic
+    - Conversation state is maintained for follow-up questions
+    - Message processing happens asynchronously
+""")
+
+_POLL_RESPONSE_DESCRIPTION = Template("""\
+Poll for the response of a previously initiated message in the $name genie space.
+
+Use this tool to retrieve results for a message that was started but not yet completed.
+The function will automatically poll until the message reaches a terminal state
+(COMPLETED, FAILED, CANCELLED) or until the timeout is reached.
+
+Args:
+    conversation_id (str): The conversation ID from query_space_$space_id
+    message_id (str): The message ID from query_space_$space_id
+    max_wait_seconds (int): Maximum seconds to wait for completion (default: 60)
+    fetch_query_results (bool): If True, fetches actual data from SQL query results (default: True)
+
+Returns:
+    dict: A comprehensive dictionary containing:
+        - status (str): Final message status
+        - query_content (str): The original query text
+        - attachments (dict): Structured attachments (text, queries, suggested questions)
+        - query_results (list): Actual data from SQL queries (if fetch_query_results=True)
+        - poll_attempts (int): Number of polling attempts made
+        - error (str): Error message if something went wrong
+
+Example response:
+    {
+        "status": "COMPLETED",
+        "query_content": "What stock had the most traded volume in 2025?",
+        "attachments": {
+            "text_responses": [],
+            "queries": [{
+                "sql": "SELECT Ticker, SUM(Volume)...",
+                "description": "Find the stock ticker with highest trading volume",
+                "statement_id": "01f0e357-6311-14c1-8d03-4676a2ddce70",
+                "row_count": 1,
+                "attachment_id": "01f0e35763041059b7102eca6703d021"
+            }],
+            "suggested_questions": [...]
+        },
+        "query_results": [{
+            "attachment_id": "01f0e35763041059b7102eca6703d021",
+            "data": [["NVDA", "51746176100"]],
+            "row_count": 1,
+            ...
+        }],
+        "poll_attempts": 5
+    }
+""")
+
+_GET_QUERY_RESULT_DESCRIPTION = Template("""\
+Fetch the actual data results from a specific SQL query attachment.
+
+Use this tool when you have a query attachment ID and want to retrieve
+the actual data rows returned by the SQL query. This is useful for:
+- Getting detailed data from a specific query
+- Re-fetching results without re-running the query
+- Accessing data from messages that have already completed
+
+Args:
+    conversation_id (str): The conversation ID
+    message_id (str): The message ID containing the query
+    attachment_id (str): The specific attachment ID for the query result
+
+Returns:
+    dict: A dictionary containing:
+        - statement_id (str): The SQL statement ID
+        - status (str): Execution status
+        - schema (dict): Column definitions
+        - data (list): Array of data rows
+        - row_count (int): Total number of rows
+        - truncated (bool): Whether results were truncated
+        - error (str): Error message if something went wrong
+
+Example response:
+    {
+        "statement_id": "01f0e357-6311-14c1-8d03-4676a2ddce70",
+        "status": "SUCCEEDED",
+        "schema": {
+            "columns": [
+                {"name": "Ticker", "type_text": "STRING", "type_name": "STRING"},
+                {"name": "total_volume", "type_text": "BIGINT", "type_name": "LONG"}
+            ]
+        },
+        "data": [["NVDA", "51746176100"]],
+        "row_count": 1,
+        "truncated": false
+    }
+""")
+
+
+def _register_space_tools(mcp_server, space: dict) -> None:
+    """
+    Register the query, poll and query-result tools for a single Genie space.
+    
+    The space's endpoint URLs are computed once here and bound into each tool,
+    so a tool call only has to append the per-request conversation and message IDs.
+    
+    Args:
+        mcp_server: The FastMCP server instance to register tools with
+        space: A GENIE_SPACES entry with "id", "name" and "topic" keys
+    """
+    space_id = space["id"]
+    space_url = _GENIE_BASE + space_id
+    start_url = space_url + "/start-conversation"
+    fields = {"space_id": space_id, "name": space["name"], "topic": space["topic"]}
+
+    @mcp_server.tool(
+        name=f"query_space_{space_id}",
+        description=_QUERY_SPACE_DESCRIPTION.substitute(fields)
+    )
+    def query_space(query: str, conversation_id: Optional[str] = None) -> dict:
+        return _start_conversation(start_url, query, conversation_id)
+
+    @mcp_server.tool(
+        name=f"poll_response_{space_id}",
+        description=_POLL_RESPONSE_DESCRIPTION.substitute(fields)
+    )
+    def poll_response(
+        conversation_id: str, 
+        message_id: str,
+        max_wait_seconds: int = 60,
+        fetch_query_results: bool = True
+    ) -> dict:
+        return _poll_message(
+            space_url, conversation_id, message_id, max_wait_seconds, fetch_query_results
+        )
+
+    @mcp_server.tool(
+        name=f"get_query_result_{space_id}",
+        description=_GET_QUERY_RESULT_DESCRIPTION.substitute(fields)
+    )
+    def get_query_result(conversation_id: str, message_id: str, attachment_id: str) -> dict:
+        return _fetch_query_result(space_url, conversation_id, message_id, attachment_id)
+
+
 def load_tools(mcp_server):
     """
     Register all MCP tools with the server.
@@ -611,669 +1394,84 @@ def load_tools(mcp_server):
             return {"error": str(e), "message": "Failed to retrieve user information"}
 
     @mcp_server.tool
-    def query_space_01f0d08866f11370b6735facce14e3ff(
-        query: str, 
-        conversation_id: Optional[str] = None
-    ) -> dict:
+    def list_genie_spaces() -> dict:
         """
-        Submit a natural language query to the US Stocks Price & Volume genie space.
-        
-        This tool submits a query to Databricks Genie and returns immediately with the
-        conversation_id and message_id. Use poll_response_01f0d08866f11370b6735facce14e3ff
-        to check the status and retrieve results.
-        
-        Features:
-        - Ask natural language questions about US stock price and volume data
-        - Get dataset summaries and overviews
-        - Continue conversations with conversation_id
-        - Returns immediately (no waiting)
-        
-        Args:
-            query (str): Natural language question to ask the Genie space
-            conversation_id (Optional[str]): Continue an existing conversation. If None, starts new conversation.
-        
-        Returns:
-            dict: A dictionary containing:
-                - conversation_id (str): The conversation ID for follow-up queries or polling
-                - message_id (str): The message ID for polling the response
-                - status (str): Initial message status (usually SUBMITTED or EXECUTING)
-                - query_content (str): The original query
-                - error (str): Error message if something went wrong
+        List the Genie spaces this server exposes tools for.
 
-        Example response:
-            {
-                "conversation_id": "01f0e34ce9641238a5018229451c2ff2",
-                "message_id": "01f0e34ce97a157983ba500ee38047ea",
-                "status": "SUBMITTED",
-                "query_content": "What stock had the most traded volume in 2025?"
-            }
-        
-        Next steps:
-            Use poll_response_01f0d08866f11370b6735facce14e3ff with the returned 
-            conversation_id and message_id to retrieve the results.
-        
-        Note:
-            - The Genie space contains historical US stock price and volume data
-            - Conversation state is maintained for follow-up questions
-            - Message processing happens asynchronously
-        """
-        space_id = "01f0d08866f11370b6735facce14e3ff"
-        
-        # Validate input
-        if not query or not query.strip():
-            return {
-                "error": "INVALID_INPUT",
-                "message": "Query cannot be empty"
-            }
-        
-        # Validate query length (reasonable limit)
-        if len(query.strip()) > 10000:
-            return {
-                "error": "INVALID_INPUT",
-                "message": "Query exceeds maximum length of 10,000 characters"
-            }
-        
-        # Validate conversation_id format if provided
-        if conversation_id:
-            if not isinstance(conversation_id, str) or len(conversation_id) < 10:
-                return {
-                    "error": "INVALID_INPUT",
-                    "message": "Invalid conversation_id format. Must be a valid UUID string."
-                }
-        
-        try:
-            # Get authenticated client
-            w = _get_workspace_client()
-            
-            # Prepare request payload
-            json_payload = {"content": query.strip()}
-            if conversation_id:
-                json_payload["conversation_id"] = conversation_id
-            
-            # Start conversation / send message
-            start_conversation_url = f"{WORKSPACE_URL}/api/2.0/genie/spaces/{space_id}/start-conversation"
-            response_dict = _make_api_request(
-                "POST", 
-                start_conversation_url, 
-                w.config.authenticate(), 
-                json_payload
-            )
-            
-            # Extract initial response data
-            message = response_dict.get("message", {})
-            conv_id = message.get("conversation_id", "")
-            msg_id = response_dict.get("message_id", "")
-            status = message.get("status", "UNKNOWN")
-            
-            if not conv_id or not msg_id:
-                return {
-                    "error": "INVALID_RESPONSE",
-                    "message": "Failed to extract conversation_id or message_id from response",
-                    "raw_response": response_dict
-                }
-            
-            return {
-                "conversation_id": conv_id,
-                "message_id": msg_id,
-                "status": status,
-                "query_content": query.strip()
-            }
-            
-        except Exception as e:
-            return {
-                "error": "QUERY_FAILED",
-                "message": str(e),
-                "conversation_id": conversation_id,
-                "query_content": query.strip()
-            }
+        Use the returned names with query_genie_by_name, or the space_id to pick
+        the matching query_space_<space_id> / poll_response_<space_id> tools.
 
-    @mcp_server.tool
-    def poll_response_01f0d08866f11370b6735facce14e3ff(
-        conversation_id: str, 
-        message_id: str,
-        max_wait_seconds: int = 60,
-        fetch_query_results: bool = True
-    ) -> dict:
-        """
-        Poll for the response of a previously initiated message in the US Stocks Price & Volume genie space.
-        
-        Use this tool to retrieve results for a message that was started but not yet completed.
-        The function will automatically poll until the message reaches a terminal state
-        (COMPLETED, FAILED, CANCELLED) or until the timeout is reached.
-        
-        Args:
-            conversation_id (str): The conversation ID from query_space_01f0d08866f11370b6735facce14e3ff
-            message_id (str): The message ID from query_space_01f0d08866f11370b6735facce14e3ff
-            max_wait_seconds (int): Maximum seconds to wait for completion (default: 60)
-            fetch_query_results (bool): If True, fetches actual data from SQL query results (default: True)
-        
         Returns:
-            dict: A comprehensive dictionary containing:
-                - status (str): Final message status
-                - query_content (str): The original query text
-                - attachments (dict): Structured attachments (text, queries, suggested questions)
-                - query_results (list): Actual data from SQL queries (if fetch_query_results=True)
-                - poll_attempts (int): Number of polling attempts made
-                - error (str): Error message if something went wrong
+            dict: A dictionary containing:
+                - spaces (list): One entry per space with space_id, name and topic
+                - count (int): Number of configured spaces
 
         Example response:
             {
-                "status": "COMPLETED",
-                "query_content": "What stock had the most traded volume in 2025?",
-                "attachments": {
-                    "text_responses": [],
-                    "queries": [{
-                        "sql": "SELECT Ticker, SUM(Volume)...",
-                        "description": "Find the stock ticker with highest trading volume",
-                        "statement_id": "01f0e357-6311-14c1-8d03-4676a2ddce70",
-                        "row_count": 1,
-                        "attachment_id": "01f0e35763041059b7102eca6703d021"
-                    }],
-                    "suggested_questions": [...]
-                },
-                "query_results": [{
-                    "attachment_id": "01f0e35763041059b7102eca6703d021",
-                    "data": [["NVDA", "51746176100"]],
-                    "row_count": 1,
-                    ...
+                "spaces": [{
+                    "space_id": "01f0d08866f11370b6735facce14e3ff",
+                    "name": "US Stocks Price & Volume",
+                    "topic": "historical US stock price and volume data"
                 }],
-                "poll_attempts": 5
+                "count": 1
             }
         """
-        space_id = "01f0d08866f11370b6735facce14e3ff"
-        
-        # Validate inputs
-        if not conversation_id or not message_id:
-            return {
-                "error": "INVALID_INPUT",
-                "message": "conversation_id and message_id are required"
-            }
-        
-        # Validate input formats
-        if not isinstance(conversation_id, str) or len(conversation_id) < 10:
-            return {
-                "error": "INVALID_INPUT",
-                "message": "Invalid conversation_id format. Must be a valid UUID string."
-            }
-        
-        if not isinstance(message_id, str) or len(message_id) < 10:
-            return {
-                "error": "INVALID_INPUT",
-                "message": "Invalid message_id format. Must be a valid UUID string."
-            }
-        
-        # Validate max_wait_seconds
-        if max_wait_seconds < 1:
-            return {
-                "error": "INVALID_INPUT",
-                "message": "max_wait_seconds must be at least 1"
-            }
-        
-        if max_wait_seconds > 600:  # 10 minutes max
-            return {
-                "error": "INVALID_INPUT",
-                "message": "max_wait_seconds cannot exceed 600 (10 minutes)"
-            }
-        
-        try:
-            # Get authenticated client
-            w = _get_workspace_client()
-            
-            # Calculate polling parameters
-            max_attempts = min(max_wait_seconds // POLL_INTERVAL_SECONDS, MAX_POLL_ATTEMPTS)
-            if max_attempts < 1:
-                max_attempts = 1
-            
-            # Poll for message completion
-            current_status = "SUBMITTED"
-            message_dict = {}
-            attempts = 0
-            
-            get_message_url = f"{WORKSPACE_URL}/api/2.0/genie/spaces/{space_id}/conversations/{conversation_id}/messages/{message_id}"
-            
-            while attempts < max_attempts:
-                attempts += 1
-                
-                # Get message status
-                message_dict = _make_api_request(
-                    "GET",
-                    get_message_url,
-                    w.config.authenticate()
-                )
-                
-                current_status = message_dict.get("status", "UNKNOWN")
-                
-                # Check if we've reached a terminal state
-                if current_status in TERMINAL_MESSAGE_STATES:
-                    break
-                
-                # Validate status is a known state
-                if current_status not in MESSAGE_STATUSES and current_status not in TERMINAL_MESSAGE_STATES:
-                    # Unknown status - log but continue polling
-                    current_status = f"UNKNOWN_{current_status}"
-                
-                # Wait before next poll
-                if attempts < max_attempts:
-                    time.sleep(POLL_INTERVAL_SECONDS)
-            
-            # Handle different terminal states
-            if current_status == "FAILED":
-                # Extract failure details from message if available
-                error_details = []
-                for attachment in message_dict.get("attachments", []):
-                    if "error" in attachment:
-                        error_details.append(attachment["error"])
-                
-                error_msg = "The Genie message failed to process"
-                if error_details:
-                    error_msg += f": {error_details[0].get('message', 'Unknown error')}"
-                
-                return {
-                    "error": "MESSAGE_FAILED",
-                    "message": error_msg,
-                    "status": current_status,
-                    "poll_attempts": attempts,
-                    "error_details": error_details,
-                    "raw_response": message_dict
-                }
-            
-            if current_status == "CANCELLED":
-                return {
-                    "error": "MESSAGE_CANCELLED",
-                    "message": "The Genie message was cancelled",
-                    "status": current_status,
-                    "poll_attempts": attempts
-                }
-            
-            if current_status == "ERROR":
-                # Extract error details
-                error_details = []
-                for attachment in message_dict.get("attachments", []):
-                    if "error" in attachment:
-                        error_details.append(attachment["error"])
-                
-                error_msg = "An error occurred during message processing"
-                if error_details:
-                    error_msg += f": {error_details[0].get('message', 'Unknown error')}"
-                
-                return {
-                    "error": "MESSAGE_ERROR",
-                    "message": error_msg,
-                    "status": current_status,
-                    "poll_attempts": attempts,
-                    "error_details": error_details
-                }
-            
-            # Check if we timed out (not in terminal state)
-            if current_status not in TERMINAL_MESSAGE_STATES:
-                return {
-                    "error": "TIMEOUT",
-                    "message": f"Message did not complete within {max_wait_seconds} seconds. Current status: {current_status}",
-                    "status": current_status,
-                    "poll_attempts": attempts,
-                    "suggestion": "Try polling again with a longer timeout or use this function again with the same conversation_id and message_id"
-                }
-            
-            # Extract structured data from completed message
-            result = {
-                "status": current_status,
-                "query_content": message_dict.get("content", ""),
-                "attachments": _extract_attachments(message_dict),
-                "poll_attempts": attempts,
-                "query_results": []
-            }
-            
-            # Fetch actual query results if requested
-            if fetch_query_results and result["attachments"]["queries"]:
-                for query_info in result["attachments"]["queries"]:
-                    attachment_id = query_info.get("attachment_id", "")
-                    
-                    if not attachment_id:
-                        continue
-                    
-                    try:
-                        # Fetch query results for this attachment
-                        query_result_url = f"{WORKSPACE_URL}/api/2.0/genie/spaces/{space_id}/conversations/{conversation_id}/messages/{message_id}/attachments/{attachment_id}/query-result"
-                        
-                        query_result_dict = _make_api_request(
-                            "GET",
-                            query_result_url,
-                            w.config.authenticate()
-                        )
-                        
-                        # Extract data from statement response
-                        statement_response = query_result_dict.get("statement_response", {})
-                        if not statement_response:
-                            result["query_results"].append({
-                                "attachment_id": attachment_id,
-                                "error": "No statement_response in query result",
-                                "raw_response": query_result_dict
-                            })
-                            continue
-                        
-                        statement_status = statement_response.get("status", {}).get("state", "UNKNOWN")
-                        statement_id = statement_response.get("statement_id", "")
-                        
-                        # Handle different statement execution states
-                        if statement_status == "SUCCEEDED":
-                            manifest = statement_response.get("manifest", {})
-                            result_data = statement_response.get("result", {})
-                            
-                            # Build structured query result
-                            query_result = {
-                                "attachment_id": attachment_id,
-                                "statement_id": statement_id,
-                                "status": statement_status,
-                                "schema": {
-                                    "columns": manifest.get("schema", {}).get("columns", [])
-                                },
-                                "data": result_data.get("data_array", []),
-                                "row_count": manifest.get("total_row_count", 0),
-                                "truncated": manifest.get("truncated", False)
-                            }
-                            
-                            # Add chunk information for large results
-                            if manifest.get("total_chunk_count", 1) > 1:
-                                query_result["chunk_info"] = {
-                                    "total_chunks": manifest.get("total_chunk_count", 1),
-                                    "current_chunk": result_data.get("chunk_index", 0),
-                                    "row_offset": result_data.get("row_offset", 0),
-                                    "note": "This result contains only a portion of the data. Additional chunks exist."
-                                }
-                            
-                            result["query_results"].append(query_result)
-                            
-                        elif statement_status in {"PENDING", "RUNNING"}:
-                            # Query is still executing
-                            result["query_results"].append({
-                                "attachment_id": attachment_id,
-                                "statement_id": statement_id,
-                                "status": statement_status,
-                                "message": f"Query execution is {statement_status.lower()}. Poll again to get results.",
-                                "note": "Query has not completed execution yet"
-                            })
-                            
-                        elif statement_status == "FAILED":
-                            # Query execution failed - extract error details
-                            status_obj = statement_response.get("status", {})
-                            error_msg = status_obj.get("error", {}).get("message", "Query execution failed")
-                            error_code = status_obj.get("error", {}).get("error_code", "UNKNOWN")
-                            
-                            result["query_results"].append({
-                                "attachment_id": attachment_id,
-                                "statement_id": statement_id,
-                                "status": statement_status,
-                                "error": f"Query execution failed [{error_code}]: {error_msg}",
-                                "error_details": status_obj.get("error", {})
-                            })
-                            
-                        elif statement_status == "CANCELLED":
-                            result["query_results"].append({
-                                "attachment_id": attachment_id,
-                                "statement_id": statement_id,
-                                "status": statement_status,
-                                "message": "Query execution was cancelled"
-                            })
-                            
-                        elif statement_status == "CLOSED":
-                            result["query_results"].append({
-                                "attachment_id": attachment_id,
-                                "statement_id": statement_id,
-                                "status": statement_status,
-                                "message": "Query execution was closed. Results may no longer be available."
-                            })
-                            
-                        else:
-                            # Unknown state
-                            result["query_results"].append({
-                                "attachment_id": attachment_id,
-                                "statement_id": statement_id,
-                                "status": statement_status,
-                                "error": f"Unknown query execution status: {statement_status}",
-                                "statement_response": statement_response
-                            })
-                            
-                    except Exception as e:
-                        # Failed to fetch results for this specific query
-                        # Don't fail the entire response, just note the error
-                        error_msg = str(e)
-                        
-                        # Check if this is a "not a valid query attachment" error
-                        if "not a valid query attachment" in error_msg.lower():
-                            result["query_results"].append({
-                                "attachment_id": attachment_id,
-                                "error": "This attachment is not a query result attachment",
-                                "note": "Only query attachments can have results fetched"
-                            })
-                        else:
-                            result["query_results"].append({
-                                "attachment_id": attachment_id,
-                                "error": f"Failed to fetch query results: {error_msg}"
-                            })
-            
-            return result
-            
-        except Exception as e:
-            return {
-                "error": "POLL_FAILED",
-                "message": str(e),
-                "conversation_id": conversation_id,
-                "message_id": message_id
-            }
+        spaces = [
+            {"space_id": space["id"], "name": space["name"], "topic": space["topic"]}
+            for space in GENIE_SPACES
+        ]
+        return {"spaces": spaces, "count": len(spaces)}
 
     @mcp_server.tool
-    def get_query_result_01f0d08866f11370b6735facce14e3ff(
-        conversation_id: str,
-        message_id: str,
-        attachment_id: str
+    def query_genie_by_name(
+        name: str,
+        query: str,
+        conversation_id: Optional[str] = None
     ) -> dict:
         """
-        Fetch the actual data results from a specific SQL query attachment.
-        
-        Use this tool when you have a query attachment ID and want to retrieve
-        the actual data rows returned by the SQL query. This is useful for:
-        - Getting detailed data from a specific query
-        - Re-fetching results without re-running the query
-        - Accessing data from messages that have already completed
-        
+        Submit a natural language query to a Genie space identified by its name.
+
+        This resolves the space name and submits the query in a single call, so there
+        is no need to look up the space_id first. It behaves like the matching
+        query_space_<space_id> tool and returns immediately.
+
         Args:
-            conversation_id (str): The conversation ID
-            message_id (str): The message ID containing the query
-            attachment_id (str): The specific attachment ID for the query result
-        
+            name (str): Name of the Genie space (case-insensitive), e.g. "US Stocks Price & Volume"
+            query (str): Natural language question to ask the Genie space
+            conversation_id (Optional[str]): Continue an existing conversation. If None, starts new conversation.
+
         Returns:
-            dict: A dictionary containing:
-                - statement_id (str): The SQL statement ID
-                - status (str): Execution status
-                - schema (dict): Column definitions
-                - data (list): Array of data rows
-                - row_count (int): Total number of rows
-                - truncated (bool): Whether results were truncated
-                - error (str): Error message if something went wrong
+            dict: The same fields as query_space_<space_id>, plus:
+                - space_id (str): The resolved Genie space ID
+                - poll_tool (str): Name of the tool to poll for the response
 
         Example response:
             {
-                "statement_id": "01f0e357-6311-14c1-8d03-4676a2ddce70",
-                "status": "SUCCEEDED",
-                "schema": {
-                    "columns": [
-                        {"name": "Ticker", "type_text": "STRING", "type_name": "STRING"},
-                        {"name": "total_volume", "type_text": "BIGINT", "type_name": "LONG"}
-                    ]
-                },
-                "data": [["NVDA", "51746176100"]],
-                "row_count": 1,
-                "truncated": false
+                "conversation_id": "01f0e34ce9641238a5018229451c2ff2",
+                "message_id": "01f0e34ce97a157983ba500ee38047ea",
+                "status": "SUBMITTED",
+                "query_content": "What stock had the most traded volume in 2025?",
+                "space_id": "01f0d08866f11370b6735facce14e3ff",
+                "poll_tool": "poll_response_01f0d08866f11370b6735facce14e3ff"
             }
         """
-        space_id = "01f0d08866f11370b6735facce14e3ff"
-        
-        # Validate inputs
-        if not all([conversation_id, message_id, attachment_id]):
-            return {
-                "error": "INVALID_INPUT",
-                "message": "conversation_id, message_id, and attachment_id are all required"
-            }
-        
-        # Validate input formats
-        if not isinstance(conversation_id, str) or len(conversation_id) < 10:
+        space_id = _SPACE_IDS_BY_NAME.get(name.strip().casefold()) if name else None
+        if not space_id:
             return {
-                "error": "INVALID_INPUT",
-                "message": "Invalid conversation_id format"
+                "error": "SPACE_NOT_FOUND",
+                "message": f"No Genie space named '{name}'",
+                "available_spaces": [space["name"] for space in GENIE_SPACES]
             }
-        
-        if not isinstance(message_id, str) or len(message_id) < 10:
-            return {
-                "error": "INVALID_INPUT",
-                "message": "Invalid message_id format"
-            }
-        
-        if not isinstance(attachment_id, str) or len(attachment_id) < 10:
-            return {
-                "error": "INVALID_INPUT",
-                "message": "Invalid attachment_id format"
-            }
-        
-        try:
-            # Get authenticated client
-            w = _get_workspace_client()
-            
-            # Fetch query results
-            query_result_url = f"{WORKSPACE_URL}/api/2.0/genie/spaces/{space_id}/conversations/{conversation_id}/messages/{message_id}/attachments/{attachment_id}/query-result"
-            
-            response_dict = _make_api_request(
-                "GET",
-                query_result_url,
-                w.config.authenticate()
-            )
-            
-            # Parse statement response
-            statement_response = response_dict.get("statement_response", {})
-            
-            if not statement_response:
-                return {
-                    "error": "INVALID_RESPONSE",
-                    "message": "No statement_response in API response",
-                    "raw_response": response_dict
-                }
-            
-            statement_id = statement_response.get("statement_id", "")
-            status_obj = statement_response.get("status", {})
-            status = status_obj.get("state", "UNKNOWN")
-            
-            # Handle different statement states
-            if status == "SUCCEEDED":
-                # Extract result data
-                manifest = statement_response.get("manifest", {})
-                result_data = statement_response.get("result", {})
-                schema = manifest.get("schema", {})
-                
-                result = {
-                    "statement_id": statement_id,
-                    "status": status,
-                    "schema": {
-                        "column_count": schema.get("column_count", 0),
-                        "columns": schema.get("columns", [])
-                    },
-                    "data": result_data.get("data_array", []),
-                    "row_count": manifest.get("total_row_count", 0),
-                    "byte_count": manifest.get("total_byte_count", 0),
-                    "truncated": manifest.get("truncated", False)
-                }
-                
-                # Add chunk information if result is chunked
-                total_chunks = manifest.get("total_chunk_count", 1)
-                if total_chunks > 1:
-                    result["chunk_info"] = {
-                        "total_chunks": total_chunks,
-                        "current_chunk": result_data.get("chunk_index", 0),
-                        "row_offset": result_data.get("row_offset", 0),
-                        "row_count_in_chunk": result_data.get("row_count", 0),
-                        "note": "This is a chunked result. Only one chunk is returned per request."
-                    }
-                
-                return result
-                
-            elif status in {"PENDING", "RUNNING"}:
-                return {
-                    "statement_id": statement_id,
-                    "status": status,
-                    "message": f"Query is still {status.lower()}. Please try again in a few moments.",
-                    "note": "Query execution has not completed yet"
-                }
-                
-            elif status == "FAILED":
-                error_info = status_obj.get("error", {})
-                error_msg = error_info.get("message", "Query execution failed")
-                error_code = error_info.get("error_code", "UNKNOWN")
-                
-                return {
-                    "error": "QUERY_EXECUTION_FAILED",
-                    "message": f"Query execution failed [{error_code}]: {error_msg}",
-                    "statement_id": statement_id,
-                    "status": status,
-                    "error_details": error_info
-                }
-                
-            elif status == "CANCELLED":
-                return {
-                    "error": "QUERY_CANCELLED",
-                    "message": "Query execution was cancelled",
-                    "statement_id": statement_id,
-                    "status": status
-                }
-                
-            elif status == "CLOSED":
-                return {
-                    "error": "QUERY_CLOSED",
-                    "message": "Query execution was closed. Results may no longer be available.",
-                    "statement_id": statement_id,
-                    "status": status
-                }
-                
-            else:
-                return {
-                    "error": "UNKNOWN_STATUS",
-                    "message": f"Unknown query execution status: {status}",
-                    "statement_id": statement_id,
-                    "status": status,
-                    "raw_response": statement_response
-                }
-            
-        except Exception as e:
-            error_str = str(e)
-            
-            # Provide more specific error messages based on the exception
-            if "not a valid query attachment" in error_str.lower():
-                return {
-                    "error": "INVALID_ATTACHMENT",
-                    "message": "The specified attachment is not a query result attachment",
-                    "conversation_id": conversation_id,
-                    "message_id": message_id,
-                    "attachment_id": attachment_id
-                }
-            elif "RESOURCE_NOT_FOUND" in error_str:
-                return {
-                    "error": "RESOURCE_NOT_FOUND",
-                    "message": "Conversation, message, or attachment not found. Please verify the IDs are correct.",
-                    "conversation_id": conversation_id,
-                    "message_id": message_id,
-                    "attachment_id": attachment_id
-                }
-            elif "PERMISSION_DENIED" in error_str:
-                return {
-                    "error": "PERMISSION_DENIED",
-                    "message": "Insufficient permissions to access this query result",
-                    "conversation_id": conversation_id,
-                    "message_id": message_id,
-                    "attachment_id": attachment_id
-                }
-            else:
-                return {
-                    "error": "FETCH_FAILED",
-                    "message": error_str,
-                    "conversation_id": conversation_id,
-                    "message_id": message_id,
-                    "attachment_id": attachment_id
-                }
 
+        result = _start_conversation(
+            _GENIE_BASE + space_id + "/start-conversation", query, conversation_id
+        )
+        result["space_id"] = space_id
+        if "error" not in result:
+            result["poll_tool"] = f"poll_response_{space_id}"
+        return result
+
+    # Register the query_space_*, poll_response_* and get_query_result_* tools
+    # for every configured Genie space
+    for space in GENIE_SPACES:
+        _register_space_tools(mcp_server, space)
@@ -0,0 +1,428 @@
+"""
+Shared pytest fixtures for the MCP integration tests.
+
+The MCP server subprocess, the authenticated WorkspaceClient and the MCP
+clients are session-scoped and live here so that every test module reuses
+the same server and credentials instead of starting its own.
+"""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple, Optional
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+from databricks.sdk import WorkspaceClient
+from databricks_mcp import DatabricksMCPClient
+from filelock import FileLock
+from requests.adapters import HTTPAdapter
+
+# Pre-serialized MCP initialize request used as the startup readiness probe
+_INITIALIZE_FRAME = (
+    b'{"jsonrpc":"2.0","id":0,"method":"initialize","params":{'
+    b'"protocolVersion":"2025-06-18","capabilities":{},'
+    b'"clientInfo":{"name":"mcp-test-startup-probe","version":"0.1.0"}}}'
+)
+_MCP_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json, text/event-stream",
+}
+
+# M2M access tokens are cached on disk so each session (and xdist worker) can skip
+# the OAuth exchange. The cache stores the token's real expiry, and a cached token is
+# only reused while enough lifetime remains to cover a full test session, since the
+# client built from it cannot refresh.
+_TOKEN_CACHE_FILE = Path.home() / ".cache" / "mcp-udp-genie" / "oauth-token.json"
+_TOKEN_MIN_REMAINING_SECONDS = 30 * 60
+
+
+@dataclass(frozen=True)
+class DbxCreds:
+    """Databricks workspace host and M2M OAuth credentials used by the tests."""
+
+    host: str
+    client_id: str
+    client_secret: str
+
+
+def _load_cached_token(creds: DbxCreds) -> Optional[str]:
+    """Return the cached access token for these credentials, if it has not expired."""
+    try:
+        cached = json.loads(_TOKEN_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    if cached.get("host") != creds.host or cached.get("client_id") != creds.client_id:
+        return None
+    if cached.get("expires_at", 0) - time.time() < _TOKEN_MIN_REMAINING_SECONDS:
+        return None
+    return cached.get("access_token")
+
+
+def _fetch_m2m_token(creds: DbxCreds) -> dict:
+    """
+    Exchange the M2M client credentials for an access token.
+
+    Uses the workspace OIDC token endpoint directly, because the response carries
+    the token's real lifetime in expires_in.
+    """
+    response = requests.post(
+        f"{creds.host}/oidc/v1/token",
+        auth=(creds.client_id, creds.client_secret),
+        data={"grant_type": "client_credentials", "scope": "all-apis"},
+        timeout=30,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def _store_cached_token(creds: DbxCreds, access_token: str, expires_in: float) -> None:
+    """Write the access token to the cache file, readable only by the current user."""
+    _TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(_TOKEN_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    # The mode above only applies when the file is created; tighten an existing one too
+    os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump({
+            "host": creds.host,
+            "client_id": creds.client_id,
+            "access_token": access_token,
+            "expires_at": time.time() + expires_in,
+        }, f)
+
+
+def _find_free_port() -> int:
+    """Find a free port on localhost."""
+    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _port_is_open(url: str, timeout: float = 1.0) -> bool:
+    """Return whether something accepts TCP connections at the URL's host and port."""
+    parsed = urlsplit(url)
+    try:
+        with socket.create_connection((parsed.hostname, parsed.port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _wait_for_server_startup(
+    url: str, session: requests.Session, timeout: int = 30
+) -> requests.Response:
+    """
+    Wait for the server to start responding.
+
+    Probes the port with a TCP connect, backing off from 5ms up to 100ms between
+    attempts. Once the listener accepts connections, sends an MCP initialize request
+    to {url}/mcp, so one round-trip confirms both HTTP readiness and that the MCP
+    endpoint completes a handshake. The request goes through the shared session so
+    its connection stays pooled.
+    """
+    parsed = urlsplit(url)
+    address = (parsed.hostname, parsed.port)
+    mcp_url = f"{url}/mcp"
+    deadline = time.monotonic() + timeout
+    delay = 0.005
+
+    while time.monotonic() < deadline:
+        with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+            port_open = s.connect_ex(address) == 0
+
+        if port_open:
+            try:
+                response = session.post(
+                    mcp_url, data=_INITIALIZE_FRAME, headers=_MCP_HEADERS, timeout=2
+                )
+                if response.status_code == 200 and '"result"' in response.text:
+                    print(f"✅ Server started successfully at {url}")
+                    return response
+            except requests.RequestException:
+                pass
+
+        time.sleep(delay)
+        delay = min(delay * 1.6, 0.1)
+
+    raise TimeoutError(f"Server at {url} did not respond in {timeout} seconds")
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Create a keep-alive HTTP session shared by all plain HTTP probes."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    yield session
+    session.close()
+
+
+def _start_server(http_session: requests.Session) -> tuple[subprocess.Popen, str]:
+    """Start the MCP server on a free port and wait until it responds."""
+    host = "127.0.0.1"
+    port = _find_free_port()
+    base_url = f"http://{host}:{port}"
+    cmd = ["uv", "run", "mcp-stonex-udp-genie", "--port", str(port)]
+
+    print(f"\n🚀 Starting MCP server on port {port}...")
+    
+    # Server output goes to an unlinked temp file rather than a pipe: nothing drains
+    # a pipe during the session, so a chatty server could block on a full buffer.
+    log = tempfile.TemporaryFile(mode="w+")
+
+    # Start the process
+    proc = subprocess.Popen(
+        cmd,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+        text=True,
+        # Start a new process group so we can kill children on teardown
+        start_new_session=os.name != 'nt',
+    )
+
+    try:
+        _wait_for_server_startup(base_url, http_session, timeout=30)
+    except Exception as e:
+        print(f"❌ Failed to start server: {e}")
+        proc.terminate()
+        with suppress(subprocess.TimeoutExpired):
+            proc.wait(timeout=5)
+        # Print server logs for debugging
+        log.seek(0)
+        print(f"Server output:\n{log.read()}")
+        raise e
+    finally:
+        # The child holds its own copy of the descriptor, so closing ours is safe
+        log.close()
+
+    return proc, base_url
+
+
+def _stop_server(proc: subprocess.Popen) -> None:
+    """
+    Stop a server started by _start_server, including its child processes.
+
+    SIGTERM gets a one second budget, checked with non-blocking polls every 20ms,
+    before the process group is escalated to SIGKILL.
+    """
+    print(f"\n🛑 Stopping MCP server...")
+    if os.name == 'nt':
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        return
+
+    with suppress(ProcessLookupError):
+        os.killpg(proc.pid, signal.SIGTERM)
+
+    deadline = time.monotonic() + 1.0
+    while time.monotonic() < deadline:
+        # poll() is a waitpid(WNOHANG) that also records the return code on proc
+        if proc.poll() is not None:
+            return
+        time.sleep(0.02)
+
+    with suppress(ProcessLookupError):
+        os.killpg(proc.pid, signal.SIGKILL)
+    proc.wait()
+
+
+def _read_worker_count(counter_file: Path) -> int:
+    """Return how many xdist workers are using the shared server."""
+    return int(counter_file.read_text()) if counter_file.is_file() else 0
+
+
+@pytest.fixture(scope="session")
+def mcp_server(http_session, tmp_path_factory):
+    """
+    Start the MCP server in a subprocess for the test session.
+    
+    Yields the base URL of the server.
+    Automatically tears down the server after tests complete.
+
+    When running under pytest-xdist, the first worker to take the file lock starts
+    the server and publishes its URL; the other workers reuse that server. The
+    starting worker keeps it running until every worker has finished.
+    """
+    if os.getenv("PYTEST_XDIST_WORKER") is None:
+        proc, base_url = _start_server(http_session)
+        yield base_url
+        _stop_server(proc)
+        return
+
+    shared_dir = tmp_path_factory.getbasetemp().parent
+    url_file = shared_dir / "mcp_server_url"
+    counter_file = shared_dir / "mcp_server_workers"
+    lock = FileLock(str(shared_dir / "mcp_server.lock"))
+
+    proc = None
+    with lock:
+        if url_file.is_file():
+            base_url = url_file.read_text()
+        else:
+            proc, base_url = _start_server(http_session)
+            url_file.write_text(base_url)
+        counter_file.write_text(str(_read_worker_count(counter_file) + 1))
+
+    # Reusing another worker's server: a quick connect check outside the lock, so a
+    # dead server fails this worker within a second without blocking the others
+    if proc is None and not _port_is_open(base_url):
+        with lock:
+            counter_file.write_text(str(_read_worker_count(counter_file) - 1))
+        raise RuntimeError(f"Shared MCP server at {base_url} is not accepting connections")
+
+    yield base_url
+
+    with lock:
+        counter_file.write_text(str(_read_worker_count(counter_file) - 1))
+
+    if proc is None:
+        return
+
+    # Wait for the other workers, then unpublish the URL so a late worker starts its own server
+    deadline = time.monotonic() + 600
+    while time.monotonic() < deadline:
+        with lock:
+            if _read_worker_count(counter_file) <= 0:
+                url_file.unlink()
+                break
+        time.sleep(0.2)
+    _stop_server(proc)
+
+
+@pytest.fixture(scope="session")
+def dbx_creds() -> DbxCreds:
+    """
+    Read Databricks credentials from the environment once per session.
+
+    The host and client ID fall back to the test workspace; the client secret has no
+    default, and tests that need credentials are skipped when it is not set.
+    """
+    client_secret = os.getenv("DATABRICKS_CLIENT_SECRET")
+    if not client_secret:
+        pytest.skip("DATABRICKS_CLIENT_SECRET is not set")
+    return DbxCreds(
+        host=os.getenv("DATABRICKS_HOST", "https://dbc-57e0a25f-9bec.cloud.databricks.com"),
+        client_id=os.getenv("DATABRICKS_CLIENT_ID", "c3df30ca-0414-446f-9ab6-834747432dcd"),
+        client_secret=client_secret,
+    )
+
+
+@pytest.fixture(scope="session")
+def workspace_client(dbx_creds):
+    """
+    Create an authenticated Databricks WorkspaceClient using M2M OAuth.
+
+    Outside CI, the access token is cached on disk with its real expiry and reused
+    by later sessions while at least 30 minutes of it remain. On CI (CI=true), or if
+    the token exchange fails here, the SDK's refreshing OAuth client is used instead.
+    """
+    def oauth_client():
+        return WorkspaceClient(
+            host=dbx_creds.host,
+            client_id=dbx_creds.client_id,
+            client_secret=dbx_creds.client_secret,
+            auth_type="oauth-m2m"
+        )
+
+    if os.getenv("CI", "").lower() == "true":
+        return oauth_client()
+
+    token = _load_cached_token(dbx_creds)
+    if token is None:
+        try:
+            fetched = _fetch_m2m_token(dbx_creds)
+        except (requests.RequestException, ValueError):
+            # Let the SDK do (and report) the exchange itself
+            return oauth_client()
+        token = fetched["access_token"]
+        with suppress(OSError):
+            _store_cached_token(dbx_creds, token, fetched.get("expires_in", 3600))
+    return WorkspaceClient(host=dbx_creds.host, token=token, auth_type="pat")
+
+
+@pytest.fixture(scope="session")
+def mcp_client(mcp_server, workspace_client):
+    """Create an authenticated MCP client connected to the local server."""
+    mcp_url = f"{mcp_server}/mcp"
+    print(f"📡 Connecting to MCP server at {mcp_url}")
+    return DatabricksMCPClient(
+        server_url=mcp_url,
+        workspace_client=workspace_client
+    )
+
+
+@pytest.fixture(scope="session")
+def mcp_client_no_auth(mcp_server):
+    """Create an MCP client without authentication for testing auth failures."""
+    mcp_url = f"{mcp_server}/mcp"
+    return DatabricksMCPClient(server_url=mcp_url)
+
+
+class WarmupResults(dict):
+    """
+    Results of the warmup calls keyed by name.
+
+    A call that raised stores its exception instead of a result; looking that key up
+    re-raises it, so only the tests that need that result fail.
+    """
+
+    def __getitem__(self, name):
+        value = super().__getitem__(name)
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+
+def _call_or_exception(call):
+    """Run one warmup call, returning its exception rather than raising it."""
+    try:
+        return call()
+    except Exception as e:
+        return e
+
+
+@pytest.fixture(scope="session")
+def tool_warmup(mcp_client) -> WarmupResults:
+    """
+    Issue the independent discovery calls concurrently, once per session.
+
+    DatabricksMCPClient's public API is synchronous and opens its own connection per
+    call, so the calls overlap on a thread pool. Returns the raw results keyed by
+    "health", "list_genie_spaces" and "list_tools". Only local calls belong here:
+    tools that reach Databricks (such as get_current_user) are called by their
+    network-marked tests so that -m "not network" stays offline.
+    """
+    calls = {
+        "health": lambda: mcp_client.call_tool("health"),
+        "list_genie_spaces": lambda: mcp_client.call_tool("list_genie_spaces"),
+        "list_tools": mcp_client.list_tools,
+    }
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = {name: executor.submit(_call_or_exception, call) for name, call in calls.items()}
+    return WarmupResults({name: future.result() for name, future in futures.items()})
+
+
+class McpTools(NamedTuple):
+    """The server's tool list, plus a set of tool names for membership checks."""
+
+    tools: list
+    names: frozenset
+
+
+@pytest.fixture(scope="session")
+def mcp_tools(tool_warmup) -> McpTools:
+    """Share the list_tools result across tests; the tool set is fixed for the session."""
+    tools = list(tool_warmup["list_tools"])
+    return McpTools(tools, frozenset(tool.name for tool in tools))
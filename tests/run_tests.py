@@ -27,7 +27,7 @@ def install_dependencies():
     """Install required test dependencies."""
     print("❌ pytest not found. Installing dependencies...")
     subprocess.run(
-        ["uv", "pip", "install", "pytest", "requests", "databricks-mcp", "databricks-sdk"],
+        ["uv", "pip", "install", "pytest", "pytest-xdist", "filelock", "requests", "databricks-mcp", "databricks-sdk"],
         check=True
     )
     print("✅ Dependencies installed")
@@ -98,7 +98,7 @@ Examples:
             install_dependencies()
         except subprocess.CalledProcessError:
             print("❌ Failed to install dependencies")
-            print("   Try manually: uv pip install pytest requests databricks-mcp databricks-sdk")
+            print("   Try manually: uv pip install pytest pytest-xdist filelock requests databricks-mcp databricks-sdk")
             return 1
     
     # Build pytest command
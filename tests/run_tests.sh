@@ -10,7 +10,7 @@ echo ""
 # Check if pytest is installed
 if ! command -v pytest &> /dev/null; then
     echo "❌ pytest not found. Installing..."
-    uv pip install pytest requests databricks-mcp databricks-sdk
+    uv pip install pytest pytest-xdist filelock requests databricks-mcp databricks-sdk
 fi
 
 # Parse command line arguments
@@ -1,3 +1,6 @@
+import os
+import sys
+
 from databricks_mcp import DatabricksMCPClient
 from databricks.sdk import WorkspaceClient
 
@@ -6,11 +9,16 @@ from databricks.sdk import WorkspaceClient
 mcp_server_url = "https://mcp-stonex-udp-genie-2808042768897897.aws.databricksapps.com/mcp"
 ws_url = "https://dbc-57e0a25f-9bec.cloud.databricks.com"
 
+# The M2M client secret is read from the environment only
+client_secret = os.getenv("DATABRICKS_CLIENT_SECRET")
+if not client_secret:
+    sys.exit("Set DATABRICKS_CLIENT_SECRET to run this script")
+
 # First, get an OAuth token using M2M credentials
 ws_client = WorkspaceClient(
     host=ws_url,
     client_id="c3df30ca-0414-446f-9ab6-834747432dcd",
-    client_secret="dose46b091345b727efd7b76361e7b44f614",
+    client_secret=client_secret,
     auth_type="oauth-m2m"
 )
 
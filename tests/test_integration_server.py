@@ -1,5 +1,4 @@
 import os
-import shlex
 import signal
 import socket
 import subprocess
@@ -18,18 +17,23 @@ def _find_free_port() -> int:
 
 
 def _wait_for_server_startup(url: str, timeout: int = 10):
-    deadline = time.time() + timeout
-
-    while time.time() < deadline:
-        try:
-            response = requests.get(url, timeout=1)
-            if 200 <= response.status_code < 400:
-                return response
-        except Exception as e:
-            last_exc = e
-        time.sleep(0.1)
-    if last_exc:
-        raise last_exc
+    host, port = url.rsplit("//", 1)[1].split(":")
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+
+    while time.monotonic() < deadline:
+        # Cheap TCP connect first; only send an HTTP request once the port is listening
+        with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
+            port_open = s.connect_ex((host, int(port))) == 0
+        if port_open:
+            try:
+                response = requests.get(url, timeout=1)
+                if 200 <= response.status_code < 400:
+                    return response
+            except requests.RequestException:
+                pass
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
 
     raise TimeoutError(f"Server at {url} did not respond in {timeout} seconds")
 
@@ -39,16 +43,16 @@ def run_mcp_server():
     host = "127.0.0.1"
     port = _find_free_port()
     url = f"http://{host}:{port}"
-    cmd = shlex.split(f"uv run custom-mcp-server --port {port}")
+    cmd = ["uv", "run", "custom-mcp-server", "--port", str(port)]
 
     # Start the process
     proc = subprocess.Popen(
         cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+        # Output is never read here; an undrained pipe could block the server
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         # Start a new process group so we can kill children on teardown
-        preexec_fn=os.setsid,
+        start_new_session=True,
         creationflags=0,
     )
 
@@ -69,18 +73,25 @@ def run_mcp_server():
         proc.wait(timeout=5)
 
 
+# One client and one tool listing shared by every test in this module
+@pytest.fixture(scope="session")
+def integration_client(run_mcp_server):
+    return DatabricksMCPClient(server_url=f"{run_mcp_server}/mcp")
+
+
+@pytest.fixture(scope="session")
+def integration_tools(integration_client):
+    return integration_client.list_tools()
+
+
 # Test List Tools runs without errors
-def test_list_tools(run_mcp_server):
-    url = run_mcp_server
-    mcp_client = DatabricksMCPClient(server_url=f"{url}/mcp")
-    tools = mcp_client.list_tools()
+def test_list_tools(integration_tools):
+    assert integration_tools is not None
 
 
 # Test Call Tools runs without errors
-def test_call_tools(run_mcp_server):
-    url = run_mcp_server
-    mcp_client = DatabricksMCPClient(server_url=f"{url}/mcp")
-    tools = mcp_client.list_tools()
-    for tool in tools:
+def test_call_tools(integration_client, integration_tools):
+    mcp_client = integration_client
+    for tool in integration_tools:
         result = mcp_client.call_tool(tool.name)
         assert result is not None
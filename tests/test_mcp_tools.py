@@ -10,25 +10,62 @@ This test suite:
 Run with: pytest tests/test_mcp_tools.py -v
 """
 
+import json
+import logging
 import os
-import shlex
-import signal
-import socket
-import subprocess
+import re
+import sys
 import time
-from contextlib import closing
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple, Optional
 
 import pytest
-import requests
-from databricks_mcp import DatabricksMCPClient
-from databricks.sdk import WorkspaceClient
 
+from server.tools import MAX_QUERY_LENGTH
 
-# Databricks credentials from environment or defaults
-WORKSPACE_URL = os.getenv("DATABRICKS_HOST", "https://dbc-57e0a25f-9bec.cloud.databricks.com")
-M2M_CLIENT_ID = os.getenv("DATABRICKS_CLIENT_ID", "c3df30ca-0414-446f-9ab6-834747432dcd")
-M2M_CLIENT_SECRET = os.getenv("DATABRICKS_CLIENT_SECRET", "dose46b091345b727efd7b76361e7b44f614")
+# orjson parses the larger tool responses noticeably faster; fall back to the stdlib
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+
+# Happy-path progress messages; skipped unless enabled with --log-cli-level=DEBUG
+logger = logging.getLogger(__name__)
+
+
+# Case-insensitive keyword checks for tool responses, compiled once so each
+# assertion is a single scan without lowercasing a copy of the response
+_HEALTH_RE = re.compile(r"healthy|status", re.IGNORECASE)
+_USER_RE = re.compile(r"user|display|name|error", re.IGNORECASE)
+_POLL_STATUS_RE = re.compile(r"status|completed", re.IGNORECASE)
+_MISSING_ARG_RE = re.compile(r"error|required", re.IGNORECASE)
+_MISSING_ARG_EXC_RE = re.compile(r"required|missing", re.IGNORECASE)
+_UNKNOWN_TOOL_RE = re.compile(r"error|not found", re.IGNORECASE)
+_UNKNOWN_TOOL_EXC_RE = re.compile(r"not found|unknown", re.IGNORECASE)
+
+# One character over the server's limit: the smallest payload that reaches the length check
+_LONG_QUERY = "x" * (MAX_QUERY_LENGTH + 1)
+
+# The Genie space exercised by these tests and its generated per-space tools
+_SPACE_ID = "01f0d08866f11370b6735facce14e3ff"
+_QUERY_TOOL = f"query_space_{_SPACE_ID}"
+_POLL_TOOL = f"poll_response_{_SPACE_ID}"
+_RESULT_TOOL = f"get_query_result_{_SPACE_ID}"
+
+# Tools the server must register, checked in one set difference by test_list_tools
+EXPECTED_TOOLS = frozenset({
+    "health",
+    "get_current_user",
+    "list_genie_spaces",
+    "query_genie_by_name",
+    _QUERY_TOOL,
+    _POLL_TOOL,
+    _RESULT_TOOL,
+})
+
+# Keep test polls short so a stuck backend fails fast; raise it for slow or cold CI
+GENIE_TEST_POLL_TIMEOUT = int(os.getenv("GENIE_TEST_POLL_TIMEOUT", "15"))
 
 
 def _extract_text_from_result(result) -> str:
@@ -41,171 +78,155 @@ def _extract_text_from_result(result) -> str:
     Returns:
         str: The text content from the result
     """
-    if hasattr(result, 'content'):
-        content = result.content
-        if isinstance(content, list):
-            for item in content:
-                if hasattr(item, 'text'):
-                    return item.text
-    return ""
+    try:
+        return result.content[0].text
+    except (AttributeError, IndexError, TypeError):
+        return ""
 
 
-def _find_free_port() -> int:
-    """Find a free port on localhost."""
-    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-        s.bind(("127.0.0.1", 0))
-        return s.getsockname()[1]
+# Parsed tool responses keyed by id(result); the result itself is kept in the
+# entry so its id cannot be reused by another object while cached
+_JSON_CACHE: dict = {}
+_JSON_CACHE_MAX = 512
 
 
-def _wait_for_server_startup(url: str, timeout: int = 30) -> requests.Response:
-    """Wait for the server to start responding."""
-    deadline = time.time() + timeout
-    last_exc = None
+def _extract_json_from_result(result):
+    """
+    Extract and parse the JSON text content from a CallToolResult object.
 
-    while time.time() < deadline:
-        try:
-            response = requests.get(url, timeout=2)
-            if 200 <= response.status_code < 400:
-                print(f"✅ Server started successfully at {url}")
-                return response
-        except Exception as e:
-            last_exc = e
-        time.sleep(0.5)
-    
-    if last_exc:
-        raise last_exc
+    The parsed value is memoized per result so repeated lookups skip both the
+    text extraction and the JSON decode.
 
-    raise TimeoutError(f"Server at {url} did not respond in {timeout} seconds")
+    Args:
+        result: CallToolResult object from mcp_client.call_tool()
 
+    Returns:
+        The decoded JSON value
 
-@pytest.fixture(scope="session")
-def mcp_server():
+    Raises:
+        json.JSONDecodeError: If the text content is not valid JSON
     """
-    Start the MCP server in a subprocess for the test session.
-    
-    Yields the base URL of the server.
-    Automatically tears down the server after tests complete.
+    cached = _JSON_CACHE.get(id(result))
+    if cached is not None and cached[0] is result:
+        return cached[1]
+
+    data = loads(_extract_text_from_result(result))
+    if len(_JSON_CACHE) >= _JSON_CACHE_MAX:
+        _JSON_CACHE.clear()
+    _JSON_CACHE[id(result)] = (result, data)
+    return data
+
+
+class SpacesFixture(NamedTuple):
+    """A list_genie_spaces response, fetched and parsed once per session."""
+
+    text: str
+    data: dict
+    first_space_id: Optional[str]
+
+
+@pytest.fixture(scope="session")
+def genie_spaces(tool_warmup) -> SpacesFixture:
+    """Parse the list_genie_spaces response once and share it across tests."""
+    result = tool_warmup["list_genie_spaces"]
+    text = _extract_text_from_result(result)
+    data = _extract_json_from_result(result)
+    spaces = data.get("spaces", [])
+    return SpacesFixture(text, data, spaces[0]["space_id"] if spaces else None)
+
+
+@pytest.fixture(scope="session")
+def first_genie_space(genie_spaces) -> dict:
+    """The first listed Genie space, shared by tests that need a real space to query."""
+    if not genie_spaces.first_space_id:
+        pytest.skip("No Genie spaces available")
+    return genie_spaces.data["spaces"][0]
+
+
+@pytest.fixture(scope="session")
+def genie_available(http_session, dbx_creds, workspace_client) -> bool:
     """
-    host = "127.0.0.1"
-    port = _find_free_port()
-    base_url = f"http://{host}:{port}"
-    cmd = shlex.split(f"uv run mcp-stonex-udp-genie --port {port}")
-
-    print(f"\n🚀 Starting MCP server on port {port}...")
-    
-    # Start the process
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        # Start a new process group so we can kill children on teardown
-        preexec_fn=os.setsid if os.name != 'nt' else None,
-    )
+    Whether the Genie space can actually be reached, probed once per session.
 
+    GETs the space from the Genie API directly; the server's list_genie_spaces is a
+    static table and says nothing about whether Databricks is up.
+    """
     try:
-        _wait_for_server_startup(base_url, timeout=30)
-    except Exception as e:
-        print(f"❌ Failed to start server: {e}")
-        proc.terminate()
-        # Print server logs for debugging
-        stdout, stderr = proc.communicate(timeout=5)
-        print(f"Server stdout:\n{stdout}")
-        print(f"Server stderr:\n{stderr}")
-        raise e
-
-    yield base_url
-
-    # Cleanup
-    print(f"\n🛑 Stopping MCP server...")
-    try:
-        if os.name != 'nt':
-            os.killpg(proc.pid, signal.SIGTERM)
-        else:
-            proc.terminate()
-        proc.wait(timeout=10)
+        response = http_session.get(
+            f"{dbx_creds.host}/api/2.0/genie/spaces/{_SPACE_ID}",
+            headers=workspace_client.config.authenticate(),
+            timeout=10
+        )
     except Exception:
-        if os.name != 'nt':
-            os.killpg(proc.pid, signal.SIGKILL)
-        else:
-            proc.kill()
-    finally:
-        try:
-            proc.wait(timeout=5)
-        except:
-            pass
+        return False
+    return response.ok
 
 
-@pytest.fixture(scope="session")
-def workspace_client():
-    """Create an authenticated Databricks WorkspaceClient using M2M OAuth."""
-    return WorkspaceClient(
-        host=WORKSPACE_URL,
-        client_id=M2M_CLIENT_ID,
-        client_secret=M2M_CLIENT_SECRET,
-        auth_type="oauth-m2m"
-    )
+class SubmittedQuery(NamedTuple):
+    """A query_space submission shared by the tests that only inspect the submit response."""
 
+    result: Any
+    text: str
+    elapsed: float
 
-@pytest.fixture(scope="session")
-def mcp_client(mcp_server, workspace_client):
-    """Create an authenticated MCP client connected to the local server."""
-    mcp_url = f"{mcp_server}/mcp"
-    print(f"📡 Connecting to MCP server at {mcp_url}")
-    return DatabricksMCPClient(
-        server_url=mcp_url,
-        workspace_client=workspace_client
+
+@pytest.fixture(scope="module")
+def submitted_datasets_query(mcp_client, genie_available) -> SubmittedQuery:
+    """Submit the "What datasets are available?" query once per module and time it."""
+    # Module fixtures are set up before the autouse skip runs, so skip here as well
+    if not genie_available:
+        pytest.skip("Genie space is not reachable")
+    start = time.perf_counter()
+    result = mcp_client.call_tool(
+        _QUERY_TOOL,
+        arguments={"query": "What datasets are available in this space?"}
     )
+    elapsed = time.perf_counter() - start
+    return SubmittedQuery(result, _extract_text_from_result(result), elapsed)
 
 
-@pytest.fixture(scope="session")
-def mcp_client_no_auth(mcp_server):
-    """Create an MCP client without authentication for testing auth failures."""
-    mcp_url = f"{mcp_server}/mcp"
-    return DatabricksMCPClient(server_url=mcp_url)
+@pytest.fixture(autouse=True)
+def _skip_if_no_genie(request):
+    """Skip tests marked needs_genie when the server has no Genie space to query."""
+    if not request.node.get_closest_marker("needs_genie"):
+        return
+    if not request.getfixturevalue("genie_available"):
+        pytest.skip("Genie space is not reachable")
 
 
 # ============================================================================
 # Test: Server Health & Discovery
 # ============================================================================
 
-def test_server_is_running(mcp_server):
+def test_server_is_running(mcp_server, http_session):
     """Test that the MCP server is running and responding."""
-    response = requests.get(mcp_server)
+    response = http_session.get(mcp_server)
     assert response.status_code in [200, 404]  # Either root page or not found is fine
-    print(f"✅ Server is running at {mcp_server}")
+    logger.debug("✅ Server is running at %s", mcp_server)
 
 
-def test_list_tools(mcp_client):
+def test_list_tools(mcp_tools):
     """Test that we can list all available tools."""
-    tools = mcp_client.list_tools()
+    tools = mcp_tools.tools
     assert len(tools) > 0, "No tools found"
     
-    tool_names = [tool.name for tool in tools]
-    print(f"✅ Found {len(tools)} tools: {tool_names}")
+    tool_names = mcp_tools.names
+    logger.debug("✅ Found %d tools: %s", len(tools), sorted(tool_names))
     
     # Verify expected tools are present
-    expected_tools = [
-        "health",
-        "get_current_user",
-        "query_space_01f0d08866f11370b6735facce14e3ff",
-        "poll_response_01f0d08866f11370b6735facce14e3ff",
-        "get_query_result_01f0d08866f11370b6735facce14e3ff"
-    ]
-    
-    for expected_tool in expected_tools:
-        assert expected_tool in tool_names, f"Expected tool '{expected_tool}' not found"
+    missing = EXPECTED_TOOLS - tool_names
+    assert not missing, f"Expected tools not found: {sorted(missing)}"
     
-    print(f"✅ All expected tools are present")
+    logger.debug("✅ All expected tools are present")
 
 
 # ============================================================================
 # Test: Health Tool
 # ============================================================================
 
-def test_health_tool(mcp_client):
+def test_health_tool(tool_warmup):
     """Test the health check tool."""
-    result = mcp_client.call_tool("health")
+    result = tool_warmup["health"]
     
     assert isinstance(result, object), "Result should be a CallToolResult object"
     assert hasattr(result, 'content'), "Result should have content attribute"
@@ -222,62 +243,107 @@ def test_health_tool(mcp_client):
             break
     
     assert text_content is not None, "Should have text content"
-    print(f"✅ Health check response: {text_content}")
+    logger.debug("✅ Health check response: %s", text_content)
     
     # Verify the response contains expected fields
-    assert "healthy" in text_content.lower() or "status" in text_content.lower()
+    assert _HEALTH_RE.search(text_content)
 
 
 # ============================================================================
 # Test: Get Current User Tool
 # ============================================================================
 
+@pytest.mark.network
 def test_get_current_user(mcp_client):
     """Test getting current user information."""
     result = mcp_client.call_tool("get_current_user")
     
     text_content = _extract_text_from_result(result)
     assert text_content, "Should have text content"
-    print(f"✅ Current user info: {text_content}")
+    logger.debug("✅ Current user info: %s", text_content)
     
     # Should contain user information or error
-    assert any(key in text_content.lower() for key in ["user", "display", "name", "error"])
+    assert _USER_RE.search(text_content)
 
 
 # ============================================================================
-# Test: Query Space Tool - Success Cases
+# Test: Genie Space Discovery
 # ============================================================================
 
-def test_query_space_simple_query(mcp_client):
-    """Test submitting a simple query to the Genie space."""
+def test_list_genie_spaces(genie_spaces):
+    """Test listing the configured Genie spaces."""
+    assert genie_spaces.text, "Should have text content"
+    logger.debug("✅ Genie spaces: %.200s...", genie_spaces.text)
+    
+    data = genie_spaces.data
+    assert data["count"] == len(data["spaces"])
+    assert _SPACE_ID in [space["space_id"] for space in data["spaces"]]
+
+
+@pytest.mark.network
+@pytest.mark.needs_genie
+def test_query_genie_by_name(mcp_client, first_genie_space):
+    """Test submitting a query by Genie space name."""
+    # Name lookup is case-insensitive
+    name = first_genie_space["name"].lower()
     result = mcp_client.call_tool(
-        "query_space_01f0d08866f11370b6735facce14e3ff",
-        arguments={"query": "What datasets are available in this space?"}
+        "query_genie_by_name",
+        arguments={"name": name, "query": "What datasets are available?"}
     )
     
     text_content = _extract_text_from_result(result)
     assert text_content, "Should have text content"
-    print(f"✅ Query submitted: {text_content[:200]}...")
+    logger.debug("✅ Query by name submitted: %.200s...", text_content)
+    
+    assert first_genie_space["space_id"] in text_content
+
+
+def test_query_genie_by_name_unknown_space(mcp_client):
+    """Test submitting a query to a space name that does not exist."""
+    result = mcp_client.call_tool(
+        "query_genie_by_name",
+        arguments={"name": "No Such Space", "query": "What datasets are available?"}
+    )
+    
+    content = _extract_text_from_result(result)
+    logger.debug("✅ Unknown space error response: %s", content)
+    
+    assert "SPACE_NOT_FOUND" in content
+
+
+# ============================================================================
+# Test: Query Space Tool - Success Cases
+# ============================================================================
+
+@pytest.mark.network
+@pytest.mark.needs_genie
+def test_query_space_simple_query(submitted_datasets_query):
+    """Test submitting a simple query to the Genie space."""
+    text_content = submitted_datasets_query.text
+    assert text_content, "Should have text content"
+    logger.debug("✅ Query submitted: %.200s...", text_content)
     
     # Should contain conversation_id and message_id for polling
-    assert "conversation_id" in text_content.lower() and "message_id" in text_content.lower()
+    data = _extract_json_from_result(submitted_datasets_query.result)
+    assert "conversation_id" in data and "message_id" in data
 
 
+@pytest.mark.network
+@pytest.mark.needs_genie
 def test_query_space_with_polling(mcp_client):
     """Test submitting a query and then polling for results."""
     # Step 1: Submit query
     submit_result = mcp_client.call_tool(
-        "query_space_01f0d08866f11370b6735facce14e3ff",
+        _QUERY_TOOL,
         arguments={"query": "What is the total row count in the dataset?"}
     )
     
     submit_content = _extract_text_from_result(submit_result)
-    print(f"✅ Query submitted: {submit_content[:200]}...")
+    logger.debug("✅ Query submitted: %.200s...", submit_content)
     
     # Extract conversation_id and message_id from response
-    import json
     try:
-        data = json.loads(submit_content)
+        data = _extract_json_from_result(submit_result)
         conversation_id = data.get("conversation_id")
         message_id = data.get("message_id")
         
@@ -286,183 +352,184 @@ def test_query_space_with_polling(mcp_client):
         
         # Step 2: Poll for results
         poll_result = mcp_client.call_tool(
-            "poll_response_01f0d08866f11370b6735facce14e3ff",
+            _POLL_TOOL,
             arguments={
                 "conversation_id": conversation_id,
                 "message_id": message_id,
-                "max_wait_seconds": 60
+                "max_wait_seconds": GENIE_TEST_POLL_TIMEOUT
             }
         )
         
         poll_content = _extract_text_from_result(poll_result)
-        print(f"✅ Poll result: {poll_content[:200]}...")
+        logger.debug("✅ Poll result: %.200s...", poll_content)
         
         # Should have a status
-        assert "status" in poll_content.lower() or "completed" in poll_content.lower()
+        assert _POLL_STATUS_RE.search(poll_content)
     except json.JSONDecodeError:
         # If we can't parse JSON, just check that we got some response
         assert submit_content, "Should have response"
 
 
-def test_query_space_returns_immediately(mcp_client):
+@pytest.mark.network
+@pytest.mark.needs_genie
+def test_query_space_returns_immediately(submitted_datasets_query):
     """Test that query_space returns immediately without waiting."""
-    import time
+    response_time = submitted_datasets_query.elapsed
+    logger.debug("✅ Query submission time: %.2f seconds", response_time)
+    logger.debug("✅ Response: %.200s...", submitted_datasets_query.text)
     
-    start_time = time.time()
-    result = mcp_client.call_tool(
-        "query_space_01f0d08866f11370b6735facce14e3ff",
-        arguments={"query": "Show me sample data"}
-    )
-    end_time = time.time()
-    
-    response_time = end_time - start_time
-    print(f"✅ Query submission time: {response_time:.2f} seconds")
-    
-    text_content = _extract_text_from_result(result)
-    print(f"✅ Response: {text_content[:200]}...")
-    
-    # Should return quickly (within 5 seconds for submission)
+    # Should return quickly (within 10 seconds for submission); the response shape
+    # is covered by test_query_space_simple_query
     assert response_time < 10, f"Query took too long: {response_time:.2f}s"
-    
-    # Should have conversation_id and message_id for polling
-    assert "conversation_id" in text_content.lower() and "message_id" in text_content.lower()
 
 
 # ============================================================================
-# Test: Query Space Tool - Error Cases
+# Test: Invalid Arguments
 # ============================================================================
 
-def test_query_space_empty_query(mcp_client):
-    """Test query with empty content."""
-    result = mcp_client.call_tool("query_space_01f0d08866f11370b6735facce14e3ff", arguments={"query": ""})
+@pytest.mark.parametrize(
+    "tool, args",
+    [
+        pytest.param(
+            _QUERY_TOOL,
+            {"query": ""},
+            id="query_space-empty-query",
+        ),
+        pytest.param(
+            "query_genie_by_name",
+            {"name": "US Stocks Price & Volume", "query": "   "},
+            id="query_genie_by_name-blank-query",
+        ),
+        pytest.param(
+            _POLL_TOOL,
+            {"conversation_id": "invalid_id", "message_id": "invalid_id"},
+            id="poll_response-invalid-ids",
+        ),
+        pytest.param(
+            _RESULT_TOOL,
+            {
+                "conversation_id": "invalid_conv_id",
+                "message_id": "invalid_msg_id",
+                "attachment_id": "invalid_att_id"
+            },
+            id="get_query_result-invalid-ids",
+        ),
+    ],
+)
+def test_invalid_args(mcp_client, tool, args):
+    """Test that tools reject empty queries and malformed IDs before calling Genie."""
+    result = mcp_client.call_tool(tool, arguments=args)
     
     content = _extract_text_from_result(result)
-    print(f"✅ Empty query error response: {content}")
+    logger.debug("✅ %s error response: %s", tool, content)
     
-    # Should return error
-    assert "error" in content.lower() or "invalid" in content.lower()
+    # Should return a validation error
+    assert _extract_json_from_result(result).get("error") == "INVALID_INPUT"
 
 
 def test_query_space_very_long_query(mcp_client):
     """Test query exceeding maximum length."""
-    long_query = "What is the stock data? " * 1000  # Create a very long query
-    
-    result = mcp_client.call_tool("query_space_01f0d08866f11370b6735facce14e3ff", arguments={"query": long_query})
+    result = mcp_client.call_tool(_QUERY_TOOL, arguments={"query": _LONG_QUERY})
     
     content = _extract_text_from_result(result)
-    print(f"✅ Long query error response: {content[:200]}...")
+    logger.debug("✅ Long query error response: %.200s...", content)
     
     # Should return error about query length
-    assert "error" in content.lower() or "length" in content.lower() or "completed" in content.lower()
+    assert _extract_json_from_result(result).get("error") == "INVALID_INPUT"
 
 
 # ============================================================================
 # Test: Poll Response Tool
 # ============================================================================
 
-def test_poll_response_invalid_ids(mcp_client):
-    """Test polling with invalid conversation/message IDs."""
-    result = mcp_client.call_tool("poll_response_01f0d08866f11370b6735facce14e3ff", arguments={"conversation_id": "invalid_id", "message_id": "invalid_id"}
-    )
-    
-    content = _extract_text_from_result(result)
-    print(f"✅ Invalid IDs error response: {content}")
-    
-    # Should return error
-    assert "error" in content.lower() or "invalid" in content.lower()
-
-
-def test_poll_response_with_short_timeout(mcp_client):
-    """Test polling with very short timeout."""
-    # First submit a query without auto-poll
-    query_result = mcp_client.call_tool("query_space_01f0d08866f11370b6735facce14e3ff", arguments={"query": "What datasets are available?"}
+def test_poll_response_invalid_conversation_id(mcp_client):
+    """Test polling with a malformed conversation ID and a well-formed message ID."""
+    result = mcp_client.call_tool(
+        _POLL_TOOL,
+        arguments={
+            "conversation_id": "01F0E34C-not-a-valid-id",
+            "message_id": "01f0e34ce97a157983ba500ee38047ea"
+        }
     )
     
-    # Extract IDs (this is a simplified extraction, actual parsing may vary)
-    # For this test, we'll use dummy IDs to test the timeout validation
-    result = mcp_client.call_tool("poll_response_01f0d08866f11370b6735facce14e3ff", arguments={"conversation_id": "01f0e34ce9641238a5018229451c2ff2"})
-    
     content = _extract_text_from_result(result)
-    print(f"✅ Poll response: {content[:200]}...")
+    logger.debug("✅ Poll response: %.200s...", content)
     
-    # Should either timeout or complete
-    assert any(word in content.lower() for word in ["timeout", "error", "not found", "completed"])
+    # Should be rejected by the server's ID validation before any Genie call
+    data = _extract_json_from_result(result)
+    assert data.get("error") == "INVALID_INPUT"
+    assert "Invalid conversation_id format" in data.get("message", "")
 
 
 # ============================================================================
 # Test: Get Query Result Tool
 # ============================================================================
 
-def test_get_query_result_invalid_ids(mcp_client):
-    """Test getting query results with invalid IDs."""
-    result = mcp_client.call_tool(
-        "get_query_result_01f0d08866f11370b6735facce14e3ff",
-        arguments={
-            "conversation_id": "invalid_conv_id",
-            "message_id": "invalid_msg_id",
-            "attachment_id": "invalid_att_id"
-        }
-    )
-    
-    content = _extract_text_from_result(result)
-    print(f"✅ Invalid IDs error response: {content}")
-    
-    # Should return error
-    assert "error" in content.lower() or "invalid" in content.lower()
-
-
 def test_get_query_result_missing_parameters(mcp_client):
     """Test getting query results with missing parameters."""
     # This should fail due to missing required parameters
     try:
-        result = mcp_client.call_tool("get_query_result_01f0d08866f11370b6735facce14e3ff", arguments={"conversation_id": "some_id"})
+        result = mcp_client.call_tool(_RESULT_TOOL, arguments={"conversation_id": "some_id"})
         # If it doesn't raise an exception, check for error in response
         content = _extract_text_from_result(result)
-        assert "error" in content.lower() or "required" in content.lower()
-        print(f"✅ Missing parameters handled: {content}")
+        assert _MISSING_ARG_RE.search(content)
+        logger.debug("✅ Missing parameters handled: %s", content)
     except Exception as e:
         # Expected to fail with missing parameters
-        print(f"✅ Missing parameters error (expected): {str(e)}")
-        assert "required" in str(e).lower() or "missing" in str(e).lower()
+        logger.debug("✅ Missing parameters error (expected): %s", e)
+        assert _MISSING_ARG_EXC_RE.search(str(e))
 
 
 # ============================================================================
 # Test: End-to-End Query Flow
 # ============================================================================
 
-def test_end_to_end_query_flow(mcp_client):
+@pytest.mark.network
+@pytest.mark.needs_genie
+def test_end_to_end_query_flow(mcp_client, submitted_datasets_query):
     """
     Test a complete end-to-end flow:
     1. Submit query without auto-poll
     2. Poll for response
     3. Extract query results (if available)
     """
-    print("\n🔄 Starting end-to-end query flow test...")
-    
-    # Step 1: Submit query
-    print("  1️⃣ Submitting query...")
-    query_result = mcp_client.call_tool(
-        "query_space_01f0d08866f11370b6735facce14e3ff",
-        arguments={"query": "What datasets are available in this space?"}
+    logger.debug("🔄 Starting end-to-end query flow test...")
+    
+    # Step 1: Submit query (shared submission)
+    logger.debug("  1️⃣ Submitting query...")
+    submitted = _extract_json_from_result(submitted_datasets_query.result)
+    logger.debug("  ✅ Query submitted: %.200s...", submitted_datasets_query.text)
+    assert "conversation_id" in submitted and "message_id" in submitted
+    
+    # Step 2: Poll for the response, fetching query results in the same call
+    logger.debug("  2️⃣ Polling for response...")
+    poll_result = mcp_client.call_tool(
+        _POLL_TOOL,
+        arguments={
+            "conversation_id": submitted["conversation_id"],
+            "message_id": submitted["message_id"],
+            "max_wait_seconds": GENIE_TEST_POLL_TIMEOUT,
+            "fetch_query_results": True
+        }
     )
+    polled = _extract_json_from_result(poll_result)
+    logger.debug("  ✅ Poll result: %.200s...", _extract_text_from_result(poll_result))
+    assert "status" in polled, f"Poll response should have a status: {polled}"
     
-    content = _extract_text_from_result(query_result)
-    print(f"  ✅ Query submitted: {content[:200]}...")
-    
-    # Verify we got a response
-    assert content is not None
-    assert len(content) > 0
+    # Step 3: Completed messages carry their query results (possibly none)
+    if polled["status"] == "COMPLETED":
+        logger.debug("  3️⃣ Checking query results...")
+        assert isinstance(polled.get("query_results"), list)
     
-    # Check if we got conversation_id and message_id
-    assert "conversation_id" in content.lower(), "Response should contain conversation_id"
-    
-    print("✅ End-to-end flow completed successfully")
+    logger.debug("✅ End-to-end flow completed successfully")
 
 
 # ============================================================================
 # Test: Concurrent Queries
 # ============================================================================
 
+@pytest.mark.network
+@pytest.mark.needs_genie
 def test_concurrent_queries(mcp_client):
     """Test that multiple queries can be handled concurrently."""
     queries = [
@@ -471,17 +538,37 @@ def test_concurrent_queries(mcp_client):
         "What is the row count?"
     ]
     
-    results = []
-    for query in queries:
-        result = mcp_client.call_tool("query_space_01f0d08866f11370b6735facce14e3ff", arguments={"query": query})
-        results.append(result)
+    def submit(query):
+        return mcp_client.call_tool(_QUERY_TOOL, arguments={"query": query})
+    
+    # Baseline: one submission on its own
+    start = time.perf_counter()
+    submit(queries[0])
+    baseline = time.perf_counter() - start
     
-    print(f"✅ Submitted {len(results)} concurrent queries")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        results = list(executor.map(submit, queries))
+    elapsed = time.perf_counter() - start
+    
+    logger.debug(
+        "✅ Submitted %d concurrent queries in %.2fs (single query baseline: %.2fs)",
+        len(results), elapsed, baseline
+    )
     
     # All should return results
     for i, result in enumerate(results):
         content = _extract_text_from_result(result)
-        print(f"  Query {i+1} response: {content[:100]}...")
+        assert content, f"Query {i+1} should have text content"
+        logger.debug("  Query %d response: %.100s...", i + 1, content)
+    
+    # Run back to back the batch would take about len(queries) baselines; overlapping
+    # submissions must finish well under that
+    serial_estimate = baseline * len(queries)
+    assert elapsed < serial_estimate * 0.75, (
+        f"Queries did not run concurrently: {elapsed:.2f}s total vs "
+        f"{serial_estimate:.2f}s expected if run one at a time"
+    )
 
 
 # ============================================================================
@@ -495,74 +582,50 @@ def test_tool_with_invalid_name(mcp_client):
         # If it doesn't raise an exception, check for error
         if result:
             content = _extract_text_from_result(result)
-            assert "error" in content.lower() or "not found" in content.lower()
+            assert _UNKNOWN_TOOL_RE.search(content)
     except Exception as e:
-        print(f"✅ Invalid tool name error (expected): {str(e)}")
-        assert "not found" in str(e).lower() or "unknown" in str(e).lower()
+        logger.debug("✅ Invalid tool name error (expected): %s", e)
+        assert _UNKNOWN_TOOL_EXC_RE.search(str(e))
 
 
 def test_resilience_after_errors(mcp_client):
     """Test that the server remains functional after error conditions."""
     # Cause an error
     try:
-        mcp_client.call_tool("query_space_01f0d08866f11370b6735facce14e3ff", arguments={"query": ""})
-    except:
+        mcp_client.call_tool(_QUERY_TOOL, arguments={"query": ""})
+    except Exception:
         pass
     
     # Server should still work
     result = mcp_client.call_tool("health")
     content = _extract_text_from_result(result)
-    assert "healthy" in content.lower() or "status" in content.lower()
-    print("✅ Server remains functional after errors")
-
-
-# ============================================================================
-# Test: Performance & Timeouts
-# ============================================================================
-
-def test_query_response_time(mcp_client):
-    """Test that queries respond within reasonable time."""
-    import time
-    
-    start_time = time.time()
-    result = mcp_client.call_tool("query_space_01f0d08866f11370b6735facce14e3ff", arguments={"query": "What datasets are available?"}
-    )
-    end_time = time.time()
-    
-    response_time = end_time - start_time
-    print(f"✅ Query submission response time: {response_time:.2f} seconds")
-    
-    # Should respond within 10 seconds for submission (not completion)
-    assert response_time < 10, f"Query took too long: {response_time:.2f}s"
+    assert _HEALTH_RE.search(content)
+    logger.debug("✅ Server remains functional after errors")
 
 
 # ============================================================================
 # Test Summary
 # ============================================================================
 
-def test_summary(mcp_client):
+def test_summary(mcp_tools):
     """Print a summary of all available tools and their status."""
-    print("\n" + "="*80)
-    print("TEST SUITE SUMMARY")
-    print("="*80)
-    
-    tools = mcp_client.list_tools()
-    print(f"\n📊 Total tools available: {len(tools)}")
+    tools = mcp_tools.tools
+    rule = "=" * 80
     
+    # Build the whole summary first and write it once
+    lines = [f"\n{rule}", "TEST SUITE SUMMARY", rule, f"\n📊 Total tools available: {len(tools)}"]
     for tool in tools:
-        print(f"\n  • {tool.name}")
-        if hasattr(tool, 'description') and tool.description:
-            # Print first line of description
-            first_line = tool.description.split('\n')[0]
-            print(f"    {first_line[:100]}...")
+        lines.append(f"\n  • {tool.name}")
+        if getattr(tool, 'description', None):
+            # First line of description
+            first_line = tool.description.split('\n', 1)[0]
+            lines.append(f"    {first_line[:100]}...")
+    lines += [f"\n{rule}", "✅ All tests completed successfully!", f"{rule}\n"]
     
-    print("\n" + "="*80)
-    print("✅ All tests completed successfully!")
-    print("="*80 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
     """Run tests directly with pytest."""
-    import sys
     pytest.main([__file__, "-v", "--tb=short"] + sys.argv[1:])
 